@@ -139,6 +139,18 @@ def _migrate_schema(engine) -> None:
         if "category_id" not in col_names:
             conn.execute(text("ALTER TABLE products ADD COLUMN category_id INTEGER"))
 
+        # create_all only runs on fresh databases; make sure existing ones
+        # also get the category filter index.
+        conn.execute(
+            text("CREATE INDEX IF NOT EXISTS ix_products_category_id ON products (category_id)")
+        )
+
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_quote_filter ON quotes (date DESC, status, client_id)"
+            )
+        )
+
         # Ensure default category
         conn.execute(
             text(
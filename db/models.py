@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Index, Integer, Numeric, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -17,7 +17,7 @@ class Product(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     ref: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
-    category_id: Mapped[int] = mapped_column(ForeignKey("product_categories.id"), nullable=True)
+    category_id: Mapped[int] = mapped_column(ForeignKey("product_categories.id"), nullable=True, index=True)
     short_desc: Mapped[str] = mapped_column(String(255), nullable=False)
     long_desc: Mapped[str] = mapped_column(Text, nullable=True)
     unit: Mapped[str] = mapped_column(String(32), nullable=False)
@@ -79,6 +79,10 @@ class Quote(Base):
     client: Mapped["Client"] = relationship(back_populates="quotes")
     lines: Mapped[list["QuoteLine"]] = relationship(back_populates="quote", cascade="all, delete-orphan")
 
+    # The quotes list filters on status/client/date range and orders by
+    # date DESC; this composite index covers that access path.
+    __table_args__ = (Index("ix_quote_filter", date.desc(), "status", "client_id"),)
+
 
 class QuoteLine(Base):
     __tablename__ = "quote_lines"
@@ -16,7 +16,16 @@ DATABASE_NAME = "orzalan.db"
 def get_engine() -> Engine:
     data_dir = get_portable_dir("data")
     db_path = data_dir / DATABASE_NAME
-    return create_engine(f"sqlite:///{db_path}", future=True)
+    # Exports run on worker threads; pooled connections may cross threads.
+    # The views issue the same handful of statement shapes over and over
+    # (list filters, pickers, exports); a roomy compiled cache keeps them
+    # from being recompiled as filters toggle.
+    return create_engine(
+        f"sqlite:///{db_path}",
+        future=True,
+        query_cache_size=1200,
+        connect_args={"check_same_thread": False},
+    )
 
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
@@ -56,3 +56,6 @@ def restore_backup(zip_file: Path) -> None:
         # Restore logo if present
         for logo in tmp_path.glob("logo.*"):
             (data_dir / logo.name).write_bytes(logo.read_bytes())
+
+    # empresa.json changed on disk; drop the in-process cache.
+    Settings.reload()
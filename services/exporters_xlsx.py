@@ -3,9 +3,11 @@ from __future__ import annotations
 from pathlib import Path
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.drawing.image import Image as XLImage
 from openpyxl.styles import Alignment, numbers
 from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
 
 from db.models import Client, Product, Quote
 from db.session import get_session
@@ -34,21 +36,63 @@ def export_quote_xlsx(path: Path, quote_id: int, include_costs: bool = False) ->
         client = session.get(Client, quote.client_id)
         lines = list(quote.lines)
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = t("quote")
+    # Write-only workbook: rows are serialized out as they are appended
+    # instead of building the whole cell graph in memory, so the footprint
+    # stays flat however many lines the quote has. Rows can only be written
+    # top-to-bottom and column widths must be set before the first append.
+    wb = Workbook(write_only=True)
 
     bold = Font(bold=True)
     right = Alignment(horizontal="right")
 
-    ws["A1"] = t("quote")
-    ws["A1"].font = bold
-    ws["A2"] = t("number")
-    ws["B2"] = quote.number
-    ws["A3"] = t("date")
-    ws["B3"] = str(quote.date)
-    ws["A4"] = t("client")
-    ws["B4"] = client.name if client else ""
+    def _styled(ws, value, font=None, alignment=None, number_format=None):
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if alignment is not None:
+            cell.alignment = alignment
+        if number_format is not None:
+            cell.number_format = number_format
+        return cell
+
+    head_rows = [
+        [t("quote")],
+        [t("number"), quote.number],
+        [t("date"), str(quote.date)],
+        [t("client"), client.name if client else ""],
+    ]
+    header = [
+        t("ref"),
+        t("description"),
+        t("unit"),
+        t("quantity"),
+        t("sale_price"),
+        t("subtotal"),
+        f"{t('vat')} %",
+        t("total"),
+    ]
+    line_values = [
+        [
+            line.ref_snapshot,
+            line.desc_snapshot,
+            line.unit_snapshot,
+            float(line.qty or 0),
+            float(line.unit_price_snapshot or 0),
+            float(line.line_subtotal or 0),
+            float(line.vat or 0) / 100.0,
+            float(line.line_total or 0),
+        ]
+        for line in lines
+    ]
+    totals_rows = [
+        [t("subtotal"), float(quote.subtotal or 0)],
+        [f"{t('vat')} %", float(quote.global_vat or 0) / 100.0],
+        [t("vat"), float(quote.vat_total or 0)],
+        [t("total"), float(quote.total or 0)],
+    ]
+
+    ws = wb.create_sheet(t("quote"))
+    _set_column_widths(ws, head_rows + [header] + line_values + totals_rows)
 
     logo_path = Settings.load().get("logo_path", "")
     logo_file = None
@@ -69,77 +113,50 @@ def export_quote_xlsx(path: Path, quote_id: int, include_costs: bool = False) ->
         except Exception:
             pass
 
-    header = [
-        t("ref"),
-        t("description"),
-        t("unit"),
-        t("quantity"),
-        t("sale_price"),
-        t("subtotal"),
-        f"{t('vat')} %",
-        t("total"),
-    ]
+    ws.append([_styled(ws, t("quote"), font=bold)])
+    for row in head_rows[1:]:
+        ws.append(row)
     ws.append([])
-    ws.append(header)
-    for cell in ws[ws.max_row]:
-        cell.font = bold
-
-    for line in lines:
-        ws.append(
-            [
-                line.ref_snapshot,
-                line.desc_snapshot,
-                line.unit_snapshot,
-                float(line.qty or 0),
-                float(line.unit_price_snapshot or 0),
-                float(line.line_subtotal or 0),
-                float(line.vat or 0) / 100.0,
-                float(line.line_total or 0),
-            ]
+    ws.append([_styled(ws, value, font=bold) for value in header])
+
+    for values in line_values:
+        row = list(values)
+        for idx in (3, 4, 5, 7):
+            row[idx] = _styled(
+                ws, row[idx], alignment=right, number_format=numbers.FORMAT_NUMBER_00
+            )
+        row[6] = _styled(
+            ws, row[6], alignment=right, number_format=numbers.FORMAT_PERCENTAGE_00
         )
-        r = ws.max_row
-        for col in (4, 5, 6, 8):
-            ws.cell(row=r, column=col).number_format = numbers.FORMAT_NUMBER_00
-            ws.cell(row=r, column=col).alignment = right
-        ws.cell(row=r, column=7).number_format = numbers.FORMAT_PERCENTAGE_00
-        ws.cell(row=r, column=7).alignment = right
+        ws.append(row)
 
     ws.append([])
-    ws.append([t("subtotal"), float(quote.subtotal or 0)])
-    ws.append([f"{t('vat')} %", float(quote.global_vat or 0) / 100.0])
-    ws.append([t("vat"), float(quote.vat_total or 0)])
-    ws.append([t("total"), float(quote.total or 0)])
-    ws.cell(row=ws.max_row - 2, column=2).alignment = right
-    ws.cell(row=ws.max_row - 2, column=2).number_format = numbers.FORMAT_NUMBER_00
-    ws.cell(row=ws.max_row - 1, column=2).number_format = numbers.FORMAT_PERCENTAGE_00
-    ws.cell(row=ws.max_row - 1, column=2).alignment = right
-    ws.cell(row=ws.max_row, column=2).number_format = numbers.FORMAT_NUMBER_00
-    ws.cell(row=ws.max_row, column=2).alignment = right
-
+    totals_formats = (
+        numbers.FORMAT_NUMBER_00,
+        numbers.FORMAT_PERCENTAGE_00,
+        numbers.FORMAT_NUMBER_00,
+        numbers.FORMAT_NUMBER_00,
+    )
+    for (label, value), number_format in zip(totals_rows, totals_formats):
+        ws.append([label, _styled(ws, value, alignment=right, number_format=number_format)])
+
+    summary_rows = [
+        [t("totals")],
+        [t("subtotal"), float(quote.subtotal or 0)],
+        [t("vat"), float(quote.vat_total or 0)],
+        [t("total"), float(quote.total or 0)],
+    ]
     ws2 = wb.create_sheet(t("summary"))
-    ws2["A1"] = t("totals")
-    ws2["A1"].font = bold
-    ws2["A2"] = t("subtotal")
-    ws2["B2"] = float(quote.subtotal or 0)
-    ws2["A3"] = t("vat")
-    ws2["B3"] = float(quote.vat_total or 0)
-    ws2["A4"] = t("total")
-    ws2["B4"] = float(quote.total or 0)
-    ws2["B2"].number_format = numbers.FORMAT_NUMBER_00
-    ws2["B3"].number_format = numbers.FORMAT_NUMBER_00
-    ws2["B4"].number_format = numbers.FORMAT_NUMBER_00
-    ws2["B2"].alignment = right
-    ws2["B3"].alignment = right
-    ws2["B4"].alignment = right
-
-    _autosize_columns(ws)
-    _autosize_columns(ws2)
+    _set_column_widths(ws2, summary_rows)
+    ws2.append([_styled(ws2, t("totals"), font=bold)])
+    for label, value in summary_rows[1:]:
+        ws2.append(
+            [label, _styled(ws2, value, alignment=right, number_format=numbers.FORMAT_NUMBER_00)]
+        )
 
     if include_costs and Settings.load().get("mostrar_costes", False):
-        ws3 = wb.create_sheet(t("cost"))
-        ws3.append([t("ref"), t("description"), t("cost"), t("margin")])
-        for cell in ws3[1]:
-            cell.font = bold
+        cost_header = [t("ref"), t("description"), t("cost"), t("margin")]
+        cost_rows = []
         with get_session() as session:
             for line in lines:
                 cost = ""
@@ -149,20 +166,25 @@ def export_quote_xlsx(path: Path, quote_id: int, include_costs: bool = False) ->
                     if product:
                         cost = float(product.cost or 0)
                         margin = float(product.margin or 0) * 100
-                ws3.append([line.ref_snapshot, line.desc_snapshot, cost, margin])
-        _autosize_columns(ws3)
+                cost_rows.append([line.ref_snapshot, line.desc_snapshot, cost, margin])
+        ws3 = wb.create_sheet(t("cost"))
+        _set_column_widths(ws3, [cost_header] + cost_rows)
+        ws3.append([_styled(ws3, value, font=bold) for value in cost_header])
+        for row in cost_rows:
+            ws3.append(row)
 
     wb.save(path)
     return path
 
 
-def _autosize_columns(ws) -> None:
-    for col_cells in ws.columns:
-        max_len = 0
-        col_letter = col_cells[0].column_letter
-        for cell in col_cells:
-            if cell.value is None:
+def _set_column_widths(ws, rows) -> None:
+    # Write-only sheets cannot be read back, so widths are derived from the
+    # raw values up front instead of a post-hoc autosize pass.
+    widths: dict[int, int] = {}
+    for row in rows:
+        for idx, value in enumerate(row, start=1):
+            if value is None:
                 continue
-            val = str(cell.value)
-            max_len = max(max_len, len(val))
-        ws.column_dimensions[col_letter].width = min(max_len + 2, 50)
+            widths[idx] = max(widths.get(idx, 0), len(str(value)))
+    for idx, width in widths.items():
+        ws.column_dimensions[get_column_letter(idx)].width = min(width + 2, 50)
@@ -10,6 +10,10 @@ from paths import get_portable_dir
 
 SETTINGS_FILE = "empresa.json"
 
+# Process-wide cached instance: load() is called from every corner of the
+# app (including each i18n lookup), so it must not hit the disk each time.
+_CACHED: "Settings | None" = None
+
 
 @dataclass
 class Settings:
@@ -17,6 +21,20 @@ class Settings:
 
     @classmethod
     def load(cls) -> "Settings":
+        global _CACHED
+        if _CACHED is None:
+            _CACHED = cls._load_from_disk()
+        return _CACHED
+
+    @classmethod
+    def reload(cls) -> "Settings":
+        """Drop the cache and re-read from disk (after a backup restore)."""
+        global _CACHED
+        _CACHED = None
+        return cls.load()
+
+    @classmethod
+    def _load_from_disk(cls) -> "Settings":
         data_dir = get_portable_dir("data")
         path = data_dir / SETTINGS_FILE
         defaults = {
@@ -7,6 +7,7 @@ class AppEvents(QObject):
     costs_visibility_changed = Signal(bool)
     language_changed = Signal(str)
     catalog_changed = Signal()
+    clients_changed = Signal()
 
 
 app_events = AppEvents()
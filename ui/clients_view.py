@@ -288,6 +288,7 @@ class ClientsView(QWidget):
             )
             session.add(client)
             session.commit()
+        app_events.clients_changed.emit()
         self._load_clients()
 
     def _edit_client(self) -> None:
@@ -324,6 +325,7 @@ class ClientsView(QWidget):
             client.phone = data.phone
             client.contact_person = data.contact
             session.commit()
+        app_events.clients_changed.emit()
         self._load_clients()
 
     def _delete_client(self) -> None:
@@ -345,6 +347,7 @@ class ClientsView(QWidget):
                 return
             session.delete(client)
             session.commit()
+        app_events.clients_changed.emit()
         self._load_clients()
 
     def _set_table_headers(self) -> None:
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QApplication
+
+
+@lru_cache(maxsize=32)
+def std_icon(sp) -> QIcon:
+    """Shared standard-icon lookup.
+
+    Every style().standardIcon() call materializes a fresh QIcon through
+    the platform theme; views rebuild their toolbars often enough that the
+    handful of icons used are worth caching per process.
+    """
+    return QApplication.style().standardIcon(sp)
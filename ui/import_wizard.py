@@ -27,6 +27,8 @@ from PySide6.QtWidgets import (
     QHeaderView,
 )
 
+from sqlalchemy import text as sa_text
+
 from db.models import Product, ProductCategory
 from db.session import get_session
 from paths import get_portable_dir
@@ -327,11 +329,16 @@ class PreviewPage(QWizardPage):
             return
         existing_cats = _get_existing_categories()
         preview = rows[:10]
+        self.model.blockSignals(True)
+        self.model.setRowCount(len(preview))
         for idx, row in enumerate(preview):
             items, errors = self._row_to_items(row, existing_cats)
-            self.model.appendRow(items)
+            for col, item in enumerate(items):
+                self.model.setItem(idx, col, item)
             for err in errors:
                 self.list_errors.addItem(f"{t('row')} {idx + 1}: {err}")
+        self.model.blockSignals(False)
+        self.model.layoutChanged.emit()
 
     def _row_to_items(self, row: dict[str, Any], existing_cats: set[str]) -> tuple[list[QStandardItem], list[str]]:
         errors: list[str] = []
@@ -343,11 +350,16 @@ class PreviewPage(QWizardPage):
 
             if field in {"ref", "short_desc"} and not text.strip():
                 errors.append(f"{t('required_field')}: {field}")
-            item = QStandardItem(text)
-            if field in {"ref", "short_desc"} and not text.strip():
-                item.setBackground(Qt.red)
             if field in {"cost", "margin", "sale_price"}:
+                # Store the parsed number so sorting and the numeric
+                # delegate work without re-parsing the text on paint.
+                item = QStandardItem()
+                item.setData(_to_float(val, 0.0), Qt.EditRole)
                 item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            else:
+                item = QStandardItem(text)
+                if field in {"ref", "short_desc"} and not text.strip():
+                    item.setBackground(Qt.red)
             if field in {"category", "category_code"}:
                 if not text.strip():
                     errors.append(t("category_empty"))
@@ -430,35 +442,52 @@ def _import_rows(
 ) -> tuple[ImportStats, list[str]]:
     stats = ImportStats()
     errors: list[str] = []
+    pending: list[dict[str, Any]] = []
 
     with get_session() as session:
-        for idx, row in enumerate(rows):
-            data = _extract_row(row, mapping)
-            if data is None:
-                stats.rejected += 1
-                errors.append(f"{t('row')} {idx + 1}: {t('required_field')}")
-                continue
-
-            ref = data["ref"]
-            existing = session.query(Product).filter(Product.ref == ref).first()
-            if existing is not None:
-                if strategy == "skip":
+        is_sqlite = session.get_bind().dialect.name == "sqlite"
+        if is_sqlite:
+            # Lower durability while the import runs; every row lands in one
+            # transaction, so a crash simply leaves the previous catalog.
+            session.execute(sa_text("PRAGMA synchronous=OFF"))
+        try:
+            for idx, row in enumerate(rows):
+                data = _extract_row(row, mapping)
+                if data is None:
                     stats.rejected += 1
-                    errors.append(f"{t('row')} {idx + 1}: {t('duplicate_ref')} {ref}")
-                    continue
-                if strategy == "suffix":
-                    ref = _unique_ref(session, ref)
-                if strategy == "update":
-                    _apply_product(existing, data)
-                    stats.updated += 1
+                    errors.append(f"{t('row')} {idx + 1}: {t('required_field')}")
                     continue
 
-            product = Product(ref=ref)
-            _apply_product(product, data)
-            session.add(product)
-            stats.inserted += 1
-
-        session.commit()
+                ref = data["ref"]
+                existing = session.query(Product).filter(Product.ref == ref).first()
+                if existing is not None:
+                    if strategy == "skip":
+                        stats.rejected += 1
+                        errors.append(f"{t('row')} {idx + 1}: {t('duplicate_ref')} {ref}")
+                        continue
+                    if strategy == "suffix":
+                        ref = _unique_ref(session, ref)
+                    if strategy == "update":
+                        _apply_product(existing, data)
+                        stats.updated += 1
+                        continue
+
+                values = _row_dict(data)
+                values["ref"] = ref
+                pending.append(values)
+                stats.inserted += 1
+
+            if pending:
+                session.bulk_insert_mappings(Product, pending)
+            session.commit()
+        finally:
+            if is_sqlite:
+                # Restore durability even when the import fails: the pooled
+                # connection outlives this session and would otherwise keep
+                # synchronous=OFF for every later write. Roll back first so
+                # the pragma runs outside any failed transaction.
+                session.rollback()
+                session.execute(sa_text("PRAGMA synchronous=FULL"))
     return stats, errors
 
 
@@ -498,17 +527,24 @@ def _extract_row(row: dict[str, Any], mapping: dict[str, str | None]) -> dict[st
     return data
 
 
-def _apply_product(product: Product, data: dict[str, Any]) -> None:
+def _row_dict(data: dict[str, Any]) -> dict[str, Any]:
     cat = _ensure_category(data.get("category_code"), data.get("category"))
-    product.category_id = cat.id if cat else None
-    product.short_desc = data["short_desc"] or ""
-    product.long_desc = data["long_desc"] or ""
-    product.unit = data["unit"] or ""
-    product.cost = data["cost"]
-    product.margin = data["margin"]
-    product.sale_price = data["sale_price"]
-    product.fixed_price = data["fixed_price"]
-    product.active = True
+    return {
+        "category_id": cat.id if cat else None,
+        "short_desc": data["short_desc"] or "",
+        "long_desc": data["long_desc"] or "",
+        "unit": data["unit"] or "",
+        "cost": data["cost"],
+        "margin": data["margin"],
+        "sale_price": data["sale_price"],
+        "fixed_price": data["fixed_price"],
+        "active": True,
+    }
+
+
+def _apply_product(product: Product, data: dict[str, Any]) -> None:
+    for key, value in _row_dict(data).items():
+        setattr(product, key, value)
 
 
 def _ensure_category(code: str | None, name: str | None) -> ProductCategory | None:
@@ -564,7 +600,13 @@ def _to_float(value: Any, default: float) -> float:
 def _to_str(value: Any) -> str:
     if value is None:
         return ""
-    return str(value).strip()
+    if type(value) is str:
+        # Avoid allocating a new string when there is nothing to strip;
+        # openpyxl hands most cells over already clean.
+        if value[:1].isspace() or value[-1:].isspace():
+            return value.strip()
+        return value
+    return str(value)
 
 
 def _read_csv(path: Path) -> tuple[list[str], list[dict[str, Any]]]:
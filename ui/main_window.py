@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QRect, QSize, Qt, QTimer, Slot
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QFrame,
@@ -16,10 +16,11 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QStackedWidget,
     QStyle,
+    QStyledItemDelegate,
     QVBoxLayout,
     QWidget,
 )
-from PySide6.QtGui import QPixmap, QPainter, QPen, QIcon
+from PySide6.QtGui import QColor, QPixmap, QPainter, QPen, QIcon
 
 from ui.backups_view import BackupsView
 from ui.clients_view import ClientsView
@@ -28,10 +29,98 @@ from ui.products_view import ProductsView
 from ui.quotes_view import QuotesView
 from ui.tools_view import ToolsView
 from ui.i18n import t, tu
+from ui.app_events import app_events
 from settings import Settings
 
 
-@dataclass(frozen=True)
+_ASSETS_DIR = Path(__file__).resolve().parents[1] / "assets"
+_LOGO_PATH = _ASSETS_DIR / "logo_orzalan.png"
+_LOGO_PIX: QPixmap | None = None
+_HAMBURGER_ICONS: dict[str, QIcon] = {}
+
+
+def _hamburger_asset(theme: str) -> QIcon | None:
+    """Load the static hamburger SVG for the theme, memoized per process."""
+    variant = "dark" if theme == "dark" else "light"
+    icon = _HAMBURGER_ICONS.get(variant)
+    if icon is not None:
+        return icon
+    path = _ASSETS_DIR / f"hamburger_{variant}.svg"
+    if not path.exists():
+        return None
+    icon = QIcon(str(path))
+    _HAMBURGER_ICONS[variant] = icon
+    return icon
+
+
+def _get_logo() -> QPixmap | None:
+    """Decode the sidebar logo once per process (requires a QApplication)."""
+    global _LOGO_PIX
+    if _LOGO_PIX is None and _LOGO_PATH.exists():
+        _LOGO_PIX = QPixmap(str(_LOGO_PATH))
+    return _LOGO_PIX
+
+
+# Nav row colors mirroring the #NavList rules in styles.qss. The app is
+# themed purely through QSS, so the widget palette never carries these;
+# the delegate keys on the window's theme property instead, the same way
+# _hamburger_asset does.
+_NAV_COLORS = {
+    "light": {
+        "text": QColor("#1f2937"),
+        "hover_bg": QColor("#e7eef9"),
+        "selected_bg": QColor("#cfe3ff"),
+        "selected_text": QColor("#0f172a"),
+    },
+    "dark": {
+        "text": QColor("#e2e8f0"),
+        "hover_bg": QColor("#1f2937"),
+        "selected_bg": QColor("#2b3a55"),
+        "selected_text": QColor("#f8fafc"),
+    },
+}
+_NAV_ACCENT = QColor("#3b82f6")
+_NAV_ACCENT_W = 3
+
+
+class NavDelegate(QStyledItemDelegate):
+    """Paint nav rows directly instead of routing each one through the
+    stylesheet cascade; the list is repolished on every theme/language
+    reload and the default delegate consults QStyle per item."""
+
+    _ICON = 20
+    _PAD = 10
+
+    def paint(self, painter, option, index) -> None:
+        rect = option.rect
+        widget = option.widget
+        theme = widget.window().property("theme") if widget is not None else None
+        colors = _NAV_COLORS["dark" if theme == "dark" else "light"]
+        selected = bool(option.state & QStyle.State_Selected)
+        if selected:
+            painter.fillRect(rect, colors["selected_bg"])
+            painter.fillRect(
+                QRect(rect.x(), rect.y(), _NAV_ACCENT_W, rect.height()), _NAV_ACCENT
+            )
+        elif option.state & QStyle.State_MouseOver:
+            painter.fillRect(rect, colors["hover_bg"])
+        x = rect.x() + self._PAD
+        icon = index.data(Qt.DecorationRole)
+        if icon is not None:
+            y = rect.y() + (rect.height() - self._ICON) // 2
+            icon.paint(painter, x, y, self._ICON, self._ICON)
+            x += self._ICON + self._PAD
+        text = index.data(Qt.DisplayRole)
+        if text:
+            painter.setPen(colors["selected_text"] if selected else colors["text"])
+            text_rect = QRect(x, rect.y(), rect.right() - x, rect.height())
+            painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, text)
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), MainWindow._ROW_H)
+
+
+@dataclass(frozen=True, slots=True)
 class NavItem:
     key: str
     label: str
@@ -39,6 +128,12 @@ class NavItem:
 
 
 class MainWindow(QMainWindow):
+    _icon_cache: dict[QStyle.StandardPixmap, QIcon] = {}
+
+    # Nav row height driven by the QSS item padding; fixed so the sidebar
+    # height can be computed without a synchronous sizeHintForRow query.
+    _ROW_H = 36
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("ORZALAN")
@@ -49,6 +144,17 @@ class MainWindow(QMainWindow):
         self._collapsed = False
         self._expanded_width = 220
         self._collapsed_width = 60
+        self._nav_items_cached = self._build_nav_items()
+        self._hamburger_cache: dict[int, QIcon] = {}
+        self._hamburger_pen: QPen | None = None
+        self._logo_last_w = -1
+        self._logo_scaled: QPixmap | None = None
+        # Coalesce resize storms: rescale the logo once per gesture
+        # instead of once per mouse pixel.
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._apply_logo)
 
         central = QWidget()
         root = QHBoxLayout(central)
@@ -71,12 +177,11 @@ class MainWindow(QMainWindow):
         self._apply_logo()
 
         if self._nav.count() > 0:
+            # setCurrentRow emits currentRowChanged, which already runs
+            # _on_nav_changed(0); calling it again doubled the dispatch.
             self._nav.setCurrentRow(0)
-            self._on_nav_changed(0)
 
-        from ui.i18n import t
         self.statusBar().showMessage(t("ready"))
-        from ui.app_events import app_events
         app_events.language_changed.connect(self._reload_texts)
 
     def _build_sidebar(self) -> QWidget:
@@ -104,9 +209,9 @@ class MainWindow(QMainWindow):
         self._title.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
         self._title.setMinimumHeight(48)
         self._title.setSizePolicy(self._title.sizePolicy().horizontalPolicy(), self._title.sizePolicy().verticalPolicy())
-        logo_path = (Path(__file__).resolve().parents[1] / "assets" / "logo_orzalan.png")
-        if logo_path.exists():
-            self._logo_pix = QPixmap(str(logo_path))
+        logo = _get_logo()
+        if logo is not None:
+            self._logo_pix = logo
         else:
             self._title.setText("ORZALAN")
 
@@ -121,6 +226,9 @@ class MainWindow(QMainWindow):
         self._nav.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self._nav.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self._nav.setSpacing(2)
+        # All nav rows share one size; lets the view skip per-item sizeHints.
+        self._nav.setUniformItemSizes(True)
+        self._nav.setItemDelegate(NavDelegate(self._nav))
 
         for item in self._nav_items():
             self._nav.addItem(self._make_nav_item(item))
@@ -129,10 +237,8 @@ class MainWindow(QMainWindow):
 
         self._nav.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         if self._nav.count() > 0:
-            row_h = self._nav.sizeHintForRow(0)
-            if row_h <= 0:
-                row_h = 36
-            total_h = (row_h * self._nav.count()) + (self._nav.spacing() * (self._nav.count() - 1)) + 24
+            n = self._nav.count()
+            total_h = (self._ROW_H * n) + (self._nav.spacing() * (n - 1)) + 24
             self._nav.setMinimumHeight(total_h)
             self._nav.setMaximumHeight(total_h)
         layout.addWidget(self._nav, 0)
@@ -164,13 +270,31 @@ class MainWindow(QMainWindow):
         stack = QStackedWidget()
         stack.setObjectName("MainStack")
 
+        # Pages are heavy (DB queries, deep widget trees); keep cheap
+        # placeholders and build the real view on first navigation.
+        self._page_built: set[int] = set()
         for item in self._nav_items():
-            page = self._build_page(item.key)
-            page.setObjectName(f"Page_{item.key}")
-            stack.addWidget(page)
+            placeholder = QWidget()
+            placeholder.setObjectName(f"Page_{item.key}")
+            stack.addWidget(placeholder)
 
         return stack
 
+    def _ensure_page(self, index: int) -> None:
+        if index in self._page_built:
+            return
+        items = self._nav_items()
+        if index >= len(items):
+            return
+        key = items[index].key
+        page = self._build_page(key)
+        page.setObjectName(f"Page_{key}")
+        placeholder = self._stack.widget(index)
+        self._stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._stack.insertWidget(index, page)
+        self._page_built.add(index)
+
     def _build_topbar(self) -> QWidget:
         bar = QFrame()
         bar.setObjectName("TopBar")
@@ -178,12 +302,12 @@ class MainWindow(QMainWindow):
         layout.setContentsMargins(18, 10, 18, 8)
         layout.setSpacing(2)
 
+        # Styled via QLabel#TopBarTitle / #TopBarSubtitle in the global QSS;
+        # per-widget setStyleSheet forces an extra parse + repolish each.
         self._section_title = QLabel("")
         self._section_title.setObjectName("TopBarTitle")
-        self._section_title.setStyleSheet("font-weight: 800; font-size: 24px; letter-spacing: 0.8px;")
         self._section_subtitle = QLabel("")
         self._section_subtitle.setObjectName("TopBarSubtitle")
-        self._section_subtitle.setStyleSheet("font-size: 12px;")
 
         layout.addWidget(self._section_title)
         layout.addWidget(self._section_subtitle)
@@ -205,6 +329,9 @@ class MainWindow(QMainWindow):
         return QWidget()
 
     def _nav_items(self) -> list[NavItem]:
+        return self._nav_items_cached
+
+    def _build_nav_items(self) -> list[NavItem]:
         return [
             NavItem("catalog", t("catalog"), QStyle.SP_DirIcon),
             NavItem("clients", t("clients"), QStyle.SP_FileDialogInfoView),
@@ -215,30 +342,45 @@ class MainWindow(QMainWindow):
         ]
 
     def _make_nav_item(self, item: NavItem) -> QListWidgetItem:
-        icon = self.style().standardIcon(item.icon)
+        icon = self._icon_cache.get(item.icon)
+        if icon is None:
+            icon = self.style().standardIcon(item.icon)
+            self._icon_cache[item.icon] = icon
         w_item = QListWidgetItem(icon, item.label)
         w_item.setData(Qt.UserRole, item.label)
         w_item.setSizeHint(w_item.sizeHint())
         return w_item
 
+    @Slot()
     def _toggle_sidebar(self) -> None:
         self._collapsed = not self._collapsed
         self._apply_sidebar_state()
 
     def _apply_sidebar_state(self) -> None:
-        if self._collapsed:
-            self._sidebar.setFixedWidth(self._collapsed_width)
-            self._title.hide()
-            for i in range(self._nav.count()):
-                item = self._nav.item(i)
-                item.setText("")
-        else:
-            self._sidebar.setFixedWidth(self._expanded_width)
-            self._title.show()
-            self._apply_logo()
-            for i in range(self._nav.count()):
-                item = self._nav.item(i)
-                item.setText(item.data(Qt.UserRole))
+        # Batch the per-item setText calls into a single repaint.
+        self._nav.setUpdatesEnabled(False)
+        self._nav.blockSignals(True)
+        try:
+            if self._collapsed:
+                self._sidebar.setFixedWidth(self._collapsed_width)
+                self._title.hide()
+                for i in range(self._nav.count()):
+                    item = self._nav.item(i)
+                    if item.text():
+                        item.setText("")
+            else:
+                self._sidebar.setFixedWidth(self._expanded_width)
+                self._title.show()
+                self._apply_logo()
+                for i in range(self._nav.count()):
+                    item = self._nav.item(i)
+                    label = item.data(Qt.UserRole)
+                    if item.text() != label:
+                        item.setText(label)
+        finally:
+            self._nav.blockSignals(False)
+            self._nav.setUpdatesEnabled(True)
+            self._nav.viewport().update()
         self._update_toggle_icon()
 
     def _update_toggle_icon(self) -> None:
@@ -246,37 +388,56 @@ class MainWindow(QMainWindow):
         self._btn_toggle.setToolTip(f"{t('show')}/{t('hide')} {t('menu').lower()}")
 
     def _hamburger_icon(self) -> QIcon:
+        asset = _hamburger_asset(self.property("theme") or "light")
+        if asset is not None:
+            return asset
+        # Fallback: paint the glyph if the SVG asset is missing.
+        color = self.palette().color(self.foregroundRole())
+        icon = self._hamburger_cache.get(color.rgb())
+        if icon is not None:
+            return icon
         size = 18
         pix = QPixmap(size, size)
         pix.fill(Qt.transparent)
         painter = QPainter(pix)
-        pen = QPen(self.palette().color(self.foregroundRole()))
-        pen.setWidth(2)
-        pen.setCapStyle(Qt.RoundCap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setPen(pen)
+        if self._hamburger_pen is None or self._hamburger_pen.color() != color:
+            pen = QPen(color)
+            pen.setWidth(2)
+            pen.setCapStyle(Qt.RoundCap)
+            self._hamburger_pen = pen
+        # No antialiasing: the glyph is three horizontal 2px lines on
+        # integer coordinates, so the AA pass buys nothing.
+        painter.setPen(self._hamburger_pen)
         for y in (4, 9, 14):
             painter.drawLine(3, y, 15, y)
         painter.end()
-        return QIcon(pix)
+        icon = QIcon(pix)
+        self._hamburger_cache[color.rgb()] = icon
+        return icon
 
+    @Slot()
     def _apply_logo(self) -> None:
         if not hasattr(self, "_logo_pix"):
             return
-        if self._collapsed:
+        if self._collapsed or not self._title.isVisible():
             return
         available_w = max(self._sidebar.width() if hasattr(self, "_sidebar") else 220, 220)
         available_w = max(available_w - self._btn_toggle.width() - 24, 60)
-        scaled = self._logo_pix.scaledToWidth(available_w, Qt.SmoothTransformation)
-        self._title.setPixmap(scaled)
-
+        if available_w != self._logo_last_w or self._logo_scaled is None:
+            # SmoothTransformation is expensive; only rescale when the
+            # target width actually changed.
+            self._logo_scaled = self._logo_pix.scaledToWidth(available_w, Qt.SmoothTransformation)
+            self._logo_last_w = available_w
+        self._title.setPixmap(self._logo_scaled)
+
+    @Slot(int)
     def _on_nav_changed(self, index: int) -> None:
         if index < 0:
             return
+        self._ensure_page(index)
         self._stack.setCurrentIndex(index)
         item = self._nav.item(index)
         label = item.data(Qt.UserRole)
-        from ui.i18n import t
         self.statusBar().showMessage(f"{t('section')}: {label}")
         items = self._nav_items()
         if index < len(items):
@@ -284,18 +445,28 @@ class MainWindow(QMainWindow):
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
-        self._apply_logo()
+        self._resize_timer.start()
 
+    @Slot(str)
     def _reload_texts(self, _lang: str) -> None:
-        from ui.i18n import t
         self._btn_toggle.setText("")
         # Sidebar labels
+        self._nav_items_cached = self._build_nav_items()
         items = self._nav_items()
-        for i, nav in enumerate(items):
-            if i < self._nav.count():
-                item = self._nav.item(i)
-                item.setText(nav.label if not self._collapsed else "")
-                item.setData(Qt.UserRole, nav.label)
+        self._nav.setUpdatesEnabled(False)
+        self._nav.blockSignals(True)
+        try:
+            for i, nav in enumerate(items):
+                if i < self._nav.count():
+                    item = self._nav.item(i)
+                    text = nav.label if not self._collapsed else ""
+                    if item.text() != text:
+                        item.setText(text)
+                    item.setData(Qt.UserRole, nav.label)
+        finally:
+            self._nav.blockSignals(False)
+            self._nav.setUpdatesEnabled(True)
+            self._nav.viewport().update()
         # Status bar
         self.statusBar().showMessage(t("ready"))
         if hasattr(self, "_lbl_repo"):
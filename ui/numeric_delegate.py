@@ -4,16 +4,27 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QStyledItemDelegate
 
 
+# Built once: initStyleOption runs for every visible cell on each repaint.
+_ALIGN_RIGHT = Qt.AlignRight | Qt.AlignVCenter
+_DIGITS = frozenset("0123456789")
+_ALLOWED = frozenset("0123456789.,% ")
+
+
 class NumericAlignDelegate(QStyledItemDelegate):
     """Align numeric-looking values to the right."""
 
     def initStyleOption(self, option, index) -> None:
         super().initStyleOption(option, index)
-        if index.data() is None:
+        data = index.data()
+        if data is None:
             return
-        text = str(index.data()).strip()
+        text = str(data).strip()
         if not text:
             return
-        candidate = text.replace(".", "").replace(",", "").replace("%", "")
-        if candidate.isdigit():
-            option.displayAlignment = Qt.AlignRight | Qt.AlignVCenter
+        # Cheap first-char gate, then a short-circuiting scan; most
+        # non-numeric cells bail after a single comparison.
+        first = text[0]
+        if first not in _DIGITS and first != "-":
+            return
+        if all(c in _ALLOWED for c in text[1:]):
+            option.displayAlignment = _ALIGN_RIGHT
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-
-from PySide6.QtCore import QSortFilterProxyModel, Qt
-from PySide6.QtGui import QStandardItem, QStandardItemModel
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+)
+from PySide6.QtGui import QColor, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QComboBox,
     QDialog,
@@ -23,6 +30,8 @@ from PySide6.QtWidgets import (
     QHeaderView,
 )
 
+from sqlalchemy import func, or_, select
+
 from db.models import Product, ProductCategory
 from db.session import get_session
 from settings import Settings
@@ -42,6 +51,14 @@ class ProductRow:
     margin: float
     price: float
     active: bool
+    # Fused lowercase search haystack, built once per row; the NUL
+    # separator keeps ref/desc from matching across the boundary.
+    haystack: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "haystack", f"{self.ref.lower()}\x00{self.desc.lower()}"
+        )
 
 
 class ProductDialog(QDialog):
@@ -131,17 +148,15 @@ class ProductDialog(QDialog):
     def _load_categories(self) -> None:
         self.cb_category.clear()
         with get_session() as session:
-            categories = session.query(ProductCategory).all()
-            categories = _sort_categories(categories)
-            for c in categories:
+            for c in _get_categories_cached(session):
                 label = f"{c.code} - {c.name}" if c.code else c.name
                 self.cb_category.addItem(label, c.id)
-            # ensure default selection
-            default = _default_category(session)
-            if default is not None:
-                idx = self.cb_category.findData(default.id)
-                if idx >= 0:
-                    self.cb_category.setCurrentIndex(idx)
+        # ensure default selection
+        default_id = _default_category_id()
+        if default_id is not None:
+            idx = self.cb_category.findData(default_id)
+            if idx >= 0:
+                self.cb_category.setCurrentIndex(idx)
 
 
 def _to_float(value: str, default: float) -> float:
@@ -151,6 +166,165 @@ def _to_float(value: str, default: float) -> float:
         return default
 
 
+_NUM_ALIGN = int(Qt.AlignRight | Qt.AlignVCenter)
+_FMT2 = "{:.2f}".format
+
+
+class ProductsTableModel(QAbstractTableModel):
+    """Table model backed by plain ProductRow records.
+
+    QStandardItemModel allocates one QObject per cell; for large catalogs
+    that dominates load time and memory, so cell values are produced on
+    demand from the dataclass list instead."""
+
+    HEADER_KEYS = (
+        "ref",
+        "category",
+        "description",
+        "unit",
+        "cost",
+        "margin",
+        "sale_price",
+        "active",
+    )
+    NUMERIC_COLS = frozenset((4, 5, 6))
+    PAGE_SIZE = 500
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: list[ProductRow] = []
+        self._total = 0
+        self._fetch_page = None
+        self.retranslate()
+
+    def retranslate(self) -> None:
+        self._headers = [t(key) for key in self.HEADER_KEYS]
+        self._active_labels = (t("inactive"), t("active"))
+        if self._rows:
+            self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._headers) - 1)
+            top = self.index(0, ProductsView.COL_ACTIVE)
+            bottom = self.index(len(self._rows) - 1, ProductsView.COL_ACTIVE)
+            self.dataChanged.emit(top, bottom)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self.HEADER_KEYS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        col = index.column()
+        if role == Qt.DisplayRole:
+            row = self._rows[index.row()]
+            if col == ProductsView.COL_REF:
+                return row.ref
+            if col == ProductsView.COL_CATEGORY:
+                return row.category
+            if col == ProductsView.COL_DESC:
+                return row.desc
+            if col == ProductsView.COL_UNIT:
+                return row.unit
+            if col == ProductsView.COL_COST:
+                return _FMT2(row.cost)
+            if col == ProductsView.COL_MARGIN:
+                return _FMT2(row.margin)
+            if col == ProductsView.COL_PRICE:
+                return _FMT2(row.price)
+            return self._active_labels[1 if row.active else 0]
+        if role == Qt.TextAlignmentRole and col in self.NUMERIC_COLS:
+            return _NUM_ALIGN
+        if role == Qt.ForegroundRole and col == ProductsView.COL_ACTIVE:
+            active = self._rows[index.row()].active
+            return QColor(Qt.darkGreen) if active else QColor(Qt.gray)
+        if role == Qt.UserRole and col == ProductsView.COL_CATEGORY:
+            return self._rows[index.row()].category_id
+        return None
+
+    def row_at(self, row: int) -> ProductRow:
+        return self._rows[row]
+
+    def set_rows(self, rows: list[ProductRow]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self._total = len(rows)
+        self._fetch_page = None
+        self.endResetModel()
+
+    def begin_paged(self, total: int, first_page: list[ProductRow], fetch_page) -> None:
+        """Reset to a windowed load; fetch_page(offset) supplies later pages."""
+        self.beginResetModel()
+        self._rows = first_page
+        self._total = total
+        self._fetch_page = fetch_page
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        if parent.isValid() or self._fetch_page is None:
+            return False
+        return len(self._rows) < self._total
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        page = self._fetch_page(len(self._rows))
+        if not page:
+            self._total = len(self._rows)
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
+
+    def insert_row(self, idx: int, row: ProductRow) -> None:
+        self.beginInsertRows(QModelIndex(), idx, idx)
+        self._rows.insert(idx, row)
+        self._total += 1
+        self.endInsertRows()
+
+    def update_row(self, idx: int, row: ProductRow) -> None:
+        self._rows[idx] = row
+        self.dataChanged.emit(
+            self.index(idx, 0), self.index(idx, self.columnCount() - 1)
+        )
+
+    def remove_row(self, idx: int) -> None:
+        self.beginRemoveRows(QModelIndex(), idx, idx)
+        del self._rows[idx]
+        self._total -= 1
+        self.endRemoveRows()
+
+
+class ProductFilterProxy(QSortFilterProxyModel):
+    """Run catalog filtering inside the proxy so only accepted rows are
+    touched, instead of a Python setRowHidden loop over every source row."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._search = ""
+        self._cat_id: int | None = None
+
+    def set_search(self, search: str) -> None:
+        self._search = search
+        self.invalidateFilter()
+
+    def set_category(self, cat_id: int | None) -> None:
+        self._cat_id = cat_id
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, row: int, parent) -> bool:
+        record = self.sourceModel().row_at(row)
+        if self._cat_id is not None and record.category_id != self._cat_id:
+            return False
+        if self._search:
+            return self._search in record.haystack
+        return True
+
+
 class ProductsView(QWidget):
     COL_REF = 0
     COL_CATEGORY = 1
@@ -164,6 +338,10 @@ class ProductsView(QWidget):
     def __init__(self) -> None:
         super().__init__()
 
+        # Reused for read-only queries; writes keep their own short
+        # sessions so transaction boundaries stay obvious.
+        self._read_session = get_session()
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(12)
@@ -196,7 +374,13 @@ class ProductsView(QWidget):
 
         self.ed_search = QLineEdit()
         self.ed_search.setPlaceholderText(t("search"))
-        self.ed_search.textChanged.connect(self._apply_filters)
+        # Coalesce keystroke bursts into one filter pass.
+        self._last_filter: tuple[str, int | None] | None = None
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self._apply_filters)
+        self.ed_search.textChanged.connect(self._filter_timer.start)
         self.ed_search.setMinimumWidth(320)
         self.ed_search.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
@@ -243,10 +427,9 @@ class ProductsView(QWidget):
         return wrapper
 
     def _build_table(self) -> QTableView:
-        self.model = QStandardItemModel(0, 8, self)
-        self._set_table_headers()
+        self.model = ProductsTableModel(self)
 
-        self.proxy = QSortFilterProxyModel(self)
+        self.proxy = ProductFilterProxy(self)
         self.proxy.setSourceModel(self.model)
         self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
 
@@ -276,60 +459,145 @@ class ProductsView(QWidget):
         self._load_products()
         return table
 
-    def _load_products(self) -> None:
-        self.model.setRowCount(0)
-        with get_session() as session:
-            rows = session.query(Product).order_by(Product.ref.asc()).all()
-            for r in rows:
-                self.model.appendRow(
-                    self._row_to_items(
-                        ProductRow(
-                            ref=r.ref,
-                            category=r.category.name if r.category else "Sin categoria",
-                            category_id=r.category_id,
-                            desc=r.short_desc or "",
-                            unit=r.unit or "",
-                            cost=float(r.cost or 0),
-                            margin=float(r.margin or 0),
-                            price=float(r.sale_price or 0),
-                            active=bool(r.active),
-                        )
-                    )
-                )
-
-    def _row_to_items(self, row: ProductRow) -> list[QStandardItem]:
-        items = [
-            QStandardItem(row.ref),
-            QStandardItem(row.category),
-            QStandardItem(row.desc),
-            QStandardItem(row.unit),
-            QStandardItem(f"{row.cost:.2f}"),
-            QStandardItem(f"{row.margin:.2f}"),
-            QStandardItem(f"{row.price:.2f}"),
-            QStandardItem(t("active") if row.active else t("inactive")),
+    # The table only needs plain values, so skip ORM hydration entirely and
+    # read Core rows; category names come from the cached id->name map
+    # instead of joining per product row.
+    _LOAD_STMT = select(
+        Product.ref,
+        Product.short_desc,
+        Product.unit,
+        Product.cost,
+        Product.margin,
+        Product.sale_price,
+        Product.active,
+        Product.category_id,
+    ).order_by(Product.ref.asc())
+
+    def _filter_clauses(self) -> list:
+        """SQL predicates mirroring the UI filters, applied to count and
+        page queries so unloaded rows are searchable too."""
+        clauses = []
+        search = self.ed_search.text().strip()
+        if search:
+            like = f"%{search}%"
+            clauses.append(
+                or_(Product.ref.ilike(like), Product.short_desc.ilike(like))
+            )
+        cat_id = self.cb_category.currentData()
+        if cat_id is not None:
+            clauses.append(Product.category_id == cat_id)
+        return clauses
+
+    def _fetch_rows(self, offset: int) -> list[ProductRow]:
+        session = self._read_session
+        stmt = self._LOAD_STMT
+        for clause in self._filter_clauses():
+            stmt = stmt.where(clause)
+        stmt = stmt.offset(offset).limit(ProductsTableModel.PAGE_SIZE)
+        cat_names = _category_names(session)
+        page = [
+            ProductRow(
+                ref=ref,
+                category=cat_names.get(cat_id, "Sin categoria"),
+                category_id=cat_id,
+                desc=desc or "",
+                unit=unit or "",
+                cost=float(cost or 0),
+                margin=float(margin or 0),
+                price=float(price or 0),
+                active=bool(active),
+            )
+            for ref, desc, unit, cost, margin, price, active, cat_id in session.execute(
+                stmt
+            )
         ]
-        items[self.COL_CATEGORY].setData(row.category_id, Qt.UserRole)
+        session.rollback()  # release the read transaction
+        for i, row in enumerate(page):
+            self._ref_to_row[row.ref] = offset + i
+        return page
 
-        color = Qt.darkGreen if row.active else Qt.gray
-        items[self.COL_ACTIVE].setForeground(color)
-        for col in (self.COL_COST, self.COL_MARGIN, self.COL_PRICE):
-            items[col].setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        return items
-
-    def _apply_filters(self) -> None:
-        search = self.ed_search.text().strip().lower()
-        cat_value = self.cb_category.currentData()
+    def _load_products(self) -> None:
+        session = self._read_session
+        session.expire_all()
+        count_stmt = select(func.count(Product.id))
+        for clause in self._filter_clauses():
+            count_stmt = count_stmt.where(clause)
+        total = session.execute(count_stmt).scalar() or 0
+
+        self._ref_to_row = {}
+        first_page = self._fetch_rows(0)
+
+        # One model reset instead of N insert signals; sorting stays off
+        # during the fill so rows are not re-sorted one by one.
+        sorting = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.begin_paged(total, first_page, self._fetch_rows)
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self.table.setSortingEnabled(sorting)
+
+    def _product_to_row(self, product: Product) -> ProductRow:
+        return ProductRow(
+            ref=product.ref,
+            category=self._category_name(product.category_id),
+            category_id=product.category_id,
+            desc=product.short_desc or "",
+            unit=product.unit or "",
+            cost=float(product.cost or 0),
+            margin=float(product.margin or 0),
+            price=float(product.sale_price or 0),
+            active=bool(product.active),
+        )
 
-        for row in range(self.model.rowCount()):
-            ref = self.model.item(row, self.COL_REF).text().lower()
-            desc = self.model.item(row, self.COL_DESC).text().lower()
-            row_cat_id = self.model.item(row, self.COL_CATEGORY).data(Qt.UserRole)
+    def _category_name(self, cat_id: int | None) -> str:
+        if cat_id is None:
+            return "Sin categoria"
+        return _category_names(self._read_session).get(cat_id, "Sin categoria")
+
+    def _append_model_row(self, row: ProductRow) -> None:
+        # With unfetched pages the new ref may belong to a page that is not
+        # loaded yet; a local insert would desync the OFFSET paging (one
+        # existing product skipped, the new one shown twice). Reload instead.
+        if self.model.canFetchMore():
+            self._load_products()
+            return
+        refs = [self.model.row_at(i).ref for i in range(self.model.rowCount())]
+        idx = bisect_left(refs, row.ref)
+        for r, i in self._ref_to_row.items():
+            if i >= idx:
+                self._ref_to_row[r] = i + 1
+        self._ref_to_row[row.ref] = idx
+        self.model.insert_row(idx, row)
+
+    def _update_model_row(self, old_ref: str, row: ProductRow) -> None:
+        idx = self._ref_to_row.pop(old_ref, None)
+        if idx is None:
+            self._load_products()
+            return
+        self._ref_to_row[row.ref] = idx
+        self.model.update_row(idx, row)
 
-            matches_search = (not search) or (search in ref) or (search in desc)
-            matches_cat = (cat_value is None) or (row_cat_id == cat_value)
+    def _remove_model_row(self, ref: str) -> None:
+        idx = self._ref_to_row.pop(ref, None)
+        if idx is None:
+            self._load_products()
+            return
+        self.model.remove_row(idx)
+        for r, i in self._ref_to_row.items():
+            if i > idx:
+                self._ref_to_row[r] = i - 1
 
-            is_visible = matches_search and matches_cat
-            self.table.setRowHidden(self.proxy.mapFromSource(self.model.index(row, 0)).row(), not is_visible)
+    def _apply_filters(self) -> None:
+        key = (self.ed_search.text().strip().lower(), self.cb_category.currentData())
+        if key == self._last_filter:
+            return
+        self._last_filter = key
+        self.proxy.set_search(key[0])
+        self.proxy.set_category(key[1])
+        # With windowed loading, unloaded rows must be searched in SQL.
+        self._load_products()
 
     def apply_cost_visibility(self, show: bool) -> None:
         self.table.setColumnHidden(self.COL_COST, not show)
@@ -351,7 +619,8 @@ class ProductsView(QWidget):
             _apply_product_values(product, data)
             session.add(product)
             session.commit()
-        self._load_products()
+            new_row = self._product_to_row(product)
+        self._append_model_row(new_row)
 
     def _open_edit_dialog(self) -> None:
         ref = self._selected_ref()
@@ -377,7 +646,8 @@ class ProductsView(QWidget):
                 product.ref = data["ref"]
             _apply_product_values(product, data)
             session.commit()
-        self._load_products()
+            updated_row = self._product_to_row(product)
+        self._update_model_row(ref, updated_row)
 
     def _delete_product(self) -> None:
         ref = self._selected_ref()
@@ -397,21 +667,28 @@ class ProductsView(QWidget):
                 return
             session.delete(product)
             session.commit()
-        self._load_products()
+        self._remove_model_row(ref)
 
     # export/import moved to Herramientas
 
     def _refresh_filters(self) -> None:
+        prev = self.cb_category.currentData()
         self.cb_category.blockSignals(True)
         self.cb_category.clear()
         self.cb_category.addItem(t("all_categories"), None)
-        with get_session() as session:
-            categories = session.query(ProductCategory).all()
-            categories = _sort_categories(categories)
-            for c in categories:
-                label = f"{c.code} - {c.name}" if c.code else c.name
-                self.cb_category.addItem(label, c.id)
+        for c in _get_categories_cached(self._read_session):
+            label = f"{c.code} - {c.name}" if c.code else c.name
+            self.cb_category.addItem(label, c.id)
+        self._read_session.rollback()
+        idx = self.cb_category.findData(prev) if prev is not None else 0
+        self.cb_category.setCurrentIndex(idx if idx >= 0 else 0)
         self.cb_category.blockSignals(False)
+        if prev is not None and idx < 0:
+            # The selected category was removed; the model window and proxy
+            # still filter on it, so drop the stale filter and reload.
+            self._last_filter = (self.ed_search.text().strip().lower(), None)
+            self.proxy.set_category(None)
+            self._load_products()
 
     def _manage_categories(self) -> None:
         dlg = _ListCrudDialog(self, t("categories"), ProductCategory)
@@ -419,18 +696,7 @@ class ProductsView(QWidget):
             self._refresh_filters()
 
     def _set_table_headers(self) -> None:
-        self.model.setHorizontalHeaderLabels(
-            [
-                t("ref"),
-                t("category"),
-                t("description"),
-                t("unit"),
-                t("cost"),
-                t("margin"),
-                t("sale_price"),
-                t("active"),
-            ]
-        )
+        self.model.retranslate()
 
     def _reload_texts(self, _lang: str) -> None:
         self.title.setText(tu("products"))
@@ -439,21 +705,25 @@ class ProductsView(QWidget):
         self.btn_add.setText(tu("new"))
         self.btn_edit.setText(tu("edit"))
         self.btn_delete.setText(tu("delete"))
+        # Headers and the active/inactive column re-render from the model's
+        # retranslated labels; no DB reload is needed for a language change.
         self._set_table_headers()
-        # refresh active/inactive labels
-        self._load_products()
         self._refresh_filters()
 
     def _reload_catalog(self) -> None:
         self._load_products()
         self._refresh_filters()
 
+    def closeEvent(self, event) -> None:
+        self._read_session.close()
+        super().closeEvent(event)
+
     def _selected_ref(self) -> str | None:
         indexes = self.table.selectionModel().selectedRows()
         if not indexes:
             return None
         source_index = self.proxy.mapToSource(indexes[0])
-        return self.model.item(source_index.row(), self.COL_REF).text()
+        return self.model.row_at(source_index.row()).ref
 
 
 def _normalize_margin(value: float) -> float:
@@ -478,10 +748,39 @@ def _apply_product_values(product: Product, data: dict) -> None:
     product.active = data["active"]
 
 
+# Categories change rarely but are re-read by every dialog; cache the sorted
+# list (and the default id) per process and drop it when the catalog changes.
+_CAT_CACHE: list[ProductCategory] | None = None
+_DEFAULT_CAT_ID: int | None = None
+
+
+def _get_categories_cached(session) -> list[ProductCategory]:
+    global _CAT_CACHE
+    if _CAT_CACHE is None:
+        _CAT_CACHE = _sort_categories(session.query(ProductCategory).all())
+    return _CAT_CACHE
+
+
+def _category_names(session) -> dict[int, str]:
+    return {c.id: c.name for c in _get_categories_cached(session)}
+
+
+def _invalidate_category_cache() -> None:
+    global _CAT_CACHE, _DEFAULT_CAT_ID
+    _CAT_CACHE = None
+    _DEFAULT_CAT_ID = None
+
+
+app_events.catalog_changed.connect(_invalidate_category_cache)
+
+
 def _default_category_id() -> int | None:
-    with get_session() as session:
-        cat = _default_category(session)
-        return cat.id if cat else None
+    global _DEFAULT_CAT_ID
+    if _DEFAULT_CAT_ID is None:
+        with get_session() as session:
+            cat = _default_category(session)
+            _DEFAULT_CAT_ID = cat.id if cat else None
+    return _DEFAULT_CAT_ID
 
 
 def _default_category(session) -> ProductCategory | None:
@@ -489,18 +788,25 @@ def _default_category(session) -> ProductCategory | None:
 
 
 def _sort_categories(categories: list[ProductCategory]) -> list[ProductCategory]:
-    def key(cat: ProductCategory) -> tuple[int, str, str]:
-        is_default = 0 if (cat.code or "").upper() == "SIN" or cat.name == "Sin categoria" else 1
+    # Decorate-sort-undecorate: uppercase each code/name exactly once.
+    keyed = []
+    for cat in categories:
         code = (cat.code or "").upper()
-        name = cat.name.upper()
-        return (is_default, code, name)
+        is_default = 0 if code == "SIN" or cat.name == "Sin categoria" else 1
+        keyed.append(((is_default, code, cat.name.upper()), cat))
+    keyed.sort(key=lambda pair: pair[0])
+    return [cat for _, cat in keyed]
+
 
-    return sorted(categories, key=key)
+# Deletion table covering Latin-1; strips non-alphanumerics in C instead of
+# a per-character Python loop.
+_CODE_DELETE_TBL = str.maketrans(
+    "", "", "".join(chr(i) for i in range(256) if not chr(i).isalnum())
+)
 
 
 def _code_from_name(name: str) -> str:
-    base = "".join([c for c in name.upper() if c.isalnum()])[:3]
-    return base or "CAT"
+    return name.upper().translate(_CODE_DELETE_TBL)[:3] or "CAT"
 
 
 class _ListCrudDialog(QDialog):
@@ -562,12 +868,19 @@ class _ListCrudDialog(QDialog):
         self._update_action_state()
 
     def _load(self) -> None:
-        self.model.setRowCount(0)
         with get_session() as session:
-            rows = session.query(self.model_cls).all()
-            rows = _sort_categories(rows)
-            for r in rows:
-                self.model.appendRow([QStandardItem(str(r.id)), QStandardItem(r.code or ""), QStandardItem(r.name)])
+            rows = _sort_categories(session.query(self.model_cls).all())
+            all_items = [
+                [QStandardItem(str(r.id)), QStandardItem(r.code or ""), QStandardItem(r.name)]
+                for r in rows
+            ]
+        self.list.setUpdatesEnabled(False)
+        try:
+            self.model.setRowCount(0)
+            for items in all_items:
+                self.model.appendRow(items)
+        finally:
+            self.list.setUpdatesEnabled(True)
 
     def _selected_id(self) -> int | None:
         indexes = self.list.selectionModel().selectedRows()
@@ -605,22 +918,30 @@ class _ListCrudDialog(QDialog):
         if not code:
             code = _code_from_name(name)
         with get_session() as session:
-            if session.query(self.model_cls).filter(self.model_cls.code == code).first() is not None:
-                QMessageBox.information(self, t("warning"), t("category_exists"))
-                return
-            if session.query(self.model_cls).filter(self.model_cls.name == name).first() is not None:
+            clash = (
+                session.query(self.model_cls.id)
+                .filter(or_(self.model_cls.code == code, self.model_cls.name == name))
+                .first()
+            )
+            if clash is not None:
                 QMessageBox.information(self, t("warning"), t("category_exists"))
                 return
-            session.add(self.model_cls(code=code, name=name))
+            obj = self.model_cls(code=code, name=name)
+            session.add(obj)
             session.commit()
+            new_id = obj.id
+        _invalidate_category_cache()
         self.ed_name.clear()
         self.ed_code.clear()
-        self._load()
+        self.model.appendRow(
+            [QStandardItem(str(new_id)), QStandardItem(code), QStandardItem(name)]
+        )
 
     def _edit(self) -> None:
         item_id = self._selected_id()
         if item_id is None:
             return
+        sel_row = self.list.selectionModel().selectedRows()[0].row()
         code = self.ed_code.text().strip().upper()
         name = self.ed_name.text().strip()
         if not name:
@@ -634,23 +955,31 @@ class _ListCrudDialog(QDialog):
             if obj.name in {"Sin categoria"} or (obj.code or "").upper() == "SIN":
                 QMessageBox.information(self, t("warning"), t("default_protected_edit"))
                 return
-            if session.query(self.model_cls).filter(self.model_cls.code == code, self.model_cls.id != obj.id).first():
-                QMessageBox.information(self, t("warning"), t("category_exists"))
-                return
-            if session.query(self.model_cls).filter(self.model_cls.name == name, self.model_cls.id != obj.id).first():
+            clash = (
+                session.query(self.model_cls.id)
+                .filter(
+                    or_(self.model_cls.code == code, self.model_cls.name == name),
+                    self.model_cls.id != obj.id,
+                )
+                .first()
+            )
+            if clash is not None:
                 QMessageBox.information(self, t("warning"), t("category_exists"))
                 return
             obj.code = code
             obj.name = name
             session.commit()
+        _invalidate_category_cache()
         self.ed_name.clear()
         self.ed_code.clear()
-        self._load()
+        self.model.item(sel_row, 1).setText(code)
+        self.model.item(sel_row, 2).setText(name)
 
     def _delete(self) -> None:
         item_id = self._selected_id()
         if item_id is None:
             return
+        sel_row = self.list.selectionModel().selectedRows()[0].row()
         with get_session() as session:
             obj = session.get(self.model_cls, item_id)
             if obj is None:
@@ -669,13 +998,14 @@ class _ListCrudDialog(QDialog):
                 updated = session.query(Product).filter(Product.category_id == obj.id).update({"category_id": default_id})
             session.delete(obj)
             session.commit()
+        _invalidate_category_cache()
         if updated:
             QMessageBox.information(
                 self,
                 t("warning"),
                 f"{t('reassigned_products')} 'Sin categoria': {updated}",
             )
-        self._load()
+        self.model.removeRow(sel_row)
         self._clear_selection()
 
     def _update_action_state(self) -> None:
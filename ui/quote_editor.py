@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from datetime import date
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import QStandardItem, QStandardItemModel
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.orm import selectinload
 from PySide6.QtWidgets import (
     QComboBox,
     QDateEdit,
@@ -19,8 +30,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QToolButton,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QHeaderView,
@@ -30,10 +40,44 @@ from db.models import Client, Product, Quote, QuoteLine
 from db.session import get_session
 from ui.i18n import t, tu
 from ui.numeric_delegate import NumericAlignDelegate
+from ui.tasks import ExportTask
 from services.exporter import export_quote_pdf, export_quote_xlsx
 from settings import Settings
 
 
+# Stored status values (either language) -> canonical i18n key. Built once;
+# the per-call dict literals this replaces were allocated on every quote open.
+_STATUS_KEYS = {
+    "draft": "draft",
+    "borrador": "draft",
+    "sent": "sent",
+    "enviado": "sent",
+    "accepted": "accepted",
+    "aceptado": "accepted",
+    "rejected": "rejected",
+    "rechazado": "rejected",
+    "rexeitado": "rejected",
+}
+
+
+def _translated_status(status: str) -> str | None:
+    key = _STATUS_KEYS.get(status.lower())
+    return t(key) if key else None
+
+
+@contextmanager
+def _batch(widget):
+    """Freeze repaints and signals while bulk-filling a widget."""
+    widget.setUpdatesEnabled(False)
+    widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        widget.blockSignals(False)
+        widget.setUpdatesEnabled(True)
+        widget.update()
+
+
 @dataclass(frozen=True)
 class LineData:
     product_id: int | None
@@ -46,10 +90,225 @@ class LineData:
     vat: float
 
 
+class QuoteLinesModel(QAbstractTableModel):
+    """Struct-of-arrays store for the editor's line table.
+
+    QTableWidget allocated a QTableWidgetItem per cell (M lines x 9 cells).
+    Here each column lives in one Python list — floats for the numeric
+    ones — so bulk loads allocate no per-cell objects and the totals pass
+    reduces directly over the float lists.
+    """
+
+    HEADER_KEYS = (
+        "quantity",
+        "ref_short",
+        "description",
+        "unit",
+        "sale_price",
+        "discount_short",
+        "vat_short",
+        "subtotal",
+        "total",
+    )
+    NUMERIC_COLS = frozenset((0, 4, 5, 6, 7, 8))
+    COMPUTED_COLS = frozenset((7, 8))
+
+    line_changed = Signal(int)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.qty: list[float] = []
+        self.price: list[float] = []
+        self.disc: list[float] = []
+        self.vat: list[float] = []
+        self.subs: list[float] = []
+        self.tots: list[float] = []
+        self.refs: list[str] = []
+        self.descs: list[str] = []
+        self.units: list[str] = []
+        self.product_ids: list[int | None] = []
+        self.retranslate()
+
+    def retranslate(self) -> None:
+        self._headers = [t(key) for key in self.HEADER_KEYS]
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._headers) - 1)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.qty)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADER_KEYS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() not in self.COMPUTED_COLS:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if col == 0:
+                return f"{self.qty[row]:.2f}"
+            if col == 1:
+                return self.refs[row]
+            if col == 2:
+                return self.descs[row]
+            if col == 3:
+                return self.units[row]
+            if col == 4:
+                return f"{self.price[row]:.2f}"
+            if col == 5:
+                return f"{self.disc[row]:.2f}"
+            if col == 6:
+                return f"{self.vat[row]:.2f}"
+            if col == 7:
+                return f"{self.subs[row]:.2f}"
+            return f"{self.tots[row]:.2f}"
+        if role == Qt.TextAlignmentRole and col in self.NUMERIC_COLS:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role == Qt.UserRole and col == 1:
+            return self.product_ids[row]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        row = index.row()
+        col = index.column()
+        text = str(value).strip()
+        if col == 0:
+            self.qty[row] = _to_float(text, 0.0)
+        elif col == 1:
+            self.refs[row] = text
+        elif col == 2:
+            self.descs[row] = text
+        elif col == 3:
+            self.units[row] = text
+        elif col == 4:
+            self.price[row] = _to_float(text, 0.0)
+        elif col == 5:
+            self.disc[row] = _to_float(text, 0.0)
+        elif col == 6:
+            self.vat[row] = _to_float(text, 0.0)
+        else:
+            return False
+        if col in (0, 4, 5, 6):
+            self._recompute_row(row)
+            self.dataChanged.emit(self.index(row, 7), self.index(row, 8))
+            self.line_changed.emit(row)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def _recompute_row(self, row: int) -> None:
+        sub = self.qty[row] * self.price[row] * (1 - self.disc[row] / 100.0)
+        self.subs[row] = sub
+        self.tots[row] = sub * (1 + self.vat[row] / 100.0)
+
+    def set_lines(self, lines: list[LineData]) -> None:
+        self.beginResetModel()
+        self.qty = [line.qty for line in lines]
+        self.price = [line.unit_price for line in lines]
+        self.disc = [line.discount for line in lines]
+        self.vat = [line.vat for line in lines]
+        self.refs = [line.ref for line in lines]
+        self.descs = [line.desc for line in lines]
+        self.units = [line.unit for line in lines]
+        self.product_ids = [line.product_id for line in lines]
+        self.subs = [0.0] * len(lines)
+        self.tots = [0.0] * len(lines)
+        for row in range(len(lines)):
+            self._recompute_row(row)
+        self.endResetModel()
+
+    def append_lines(self, lines: list[LineData]) -> None:
+        if not lines:
+            return
+        start = len(self.qty)
+        self.beginInsertRows(QModelIndex(), start, start + len(lines) - 1)
+        for line in lines:
+            self.qty.append(line.qty)
+            self.price.append(line.unit_price)
+            self.disc.append(line.discount)
+            self.vat.append(line.vat)
+            self.refs.append(line.ref)
+            self.descs.append(line.desc)
+            self.units.append(line.unit)
+            self.product_ids.append(line.product_id)
+            self.subs.append(0.0)
+            self.tots.append(0.0)
+            self._recompute_row(len(self.qty) - 1)
+        self.endInsertRows()
+
+    def line_datas(self) -> list[LineData]:
+        return [
+            LineData(
+                product_id=self.product_ids[row],
+                ref=self.refs[row],
+                desc=self.descs[row],
+                unit=self.units[row],
+                qty=self.qty[row],
+                unit_price=self.price[row],
+                discount=self.disc[row],
+                vat=self.vat[row],
+            )
+            for row in range(len(self.qty))
+        ]
+
+    def remove_row(self, row: int) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        for column in (
+            self.qty,
+            self.price,
+            self.disc,
+            self.vat,
+            self.refs,
+            self.descs,
+            self.units,
+            self.product_ids,
+            self.subs,
+            self.tots,
+        ):
+            del column[row]
+        self.endRemoveRows()
+
+
+class _PickerFilterProxy(QSortFilterProxyModel):
+    """Narrow the loaded page instantly while the debounced SQL reload runs.
+
+    The haystack (lowercased ref + desc) is precomputed at load time and
+    stored on the hidden ID column, so accepting a row is one substring test
+    with no per-row lowercasing or allocation.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._needle = ""
+
+    def set_needle(self, text: str) -> None:
+        self._needle = text.strip().lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+        if not self._needle:
+            return True
+        haystack = self.sourceModel().index(source_row, 0, source_parent).data(Qt.UserRole)
+        return haystack is not None and self._needle in haystack
+
+
 class ProductPicker(QDialog):
+    PAGE_SIZE = 200
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        from ui.i18n import t
         self.setWindowTitle(t("add_from_catalog"))
         self.setMinimumWidth(600)
 
@@ -57,23 +316,30 @@ class ProductPicker(QDialog):
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
 
+        self._page = 0
+        self._last_needle: str | None = None
         self.ed_search = QLineEdit()
-        from ui.i18n import t
         self.ed_search.setPlaceholderText(t("search"))
-        self.ed_search.textChanged.connect(self._apply_filter)
+        # Filtering happens in SQL; debounce so a keystroke burst costs one query.
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._reload_products)
+        self.ed_search.textChanged.connect(self._search_timer.start)
         layout.addWidget(self.ed_search)
 
         self.model = QStandardItemModel(0, 5, self)
         self.model.setHorizontalHeaderLabels(["ID", t("ref"), t("description"), t("unit"), t("sale_price")])
-
-        from PySide6.QtWidgets import QTableView
+        self._proxy = _PickerFilterProxy(self)
+        self._proxy.setSourceModel(self.model)
+        self.ed_search.textChanged.connect(self._proxy.set_needle)
 
         self.table = QTableView()
-        self.table.setModel(self.model)
+        self.table.setModel(self._proxy)
         self.table.setSortingEnabled(True)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QTableView.SelectRows)
-        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.setSelectionMode(QTableView.ExtendedSelection)
         self.table.setEditTriggers(QTableView.NoEditTriggers)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.verticalHeader().setVisible(False)
@@ -83,8 +349,15 @@ class ProductPicker(QDialog):
         self.table.doubleClicked.connect(self._accept_on_double_click)
 
         actions = QHBoxLayout()
+        self.btn_prev = QToolButton()
+        self.btn_prev.setText("◀")
+        self.btn_prev.clicked.connect(self._prev_page)
+        self.btn_next = QToolButton()
+        self.btn_next.setText("▶")
+        self.btn_next.clicked.connect(self._next_page)
+        actions.addWidget(self.btn_prev)
+        actions.addWidget(self.btn_next)
         actions.addStretch(1)
-        from ui.i18n import t
         btn_cancel = QPushButton(tu("cancel"))
         btn_ok = QPushButton(tu("add"))
         btn_ok.setDefault(True)
@@ -97,47 +370,93 @@ class ProductPicker(QDialog):
         self._load_products()
 
     def _accept_on_double_click(self) -> None:
-        if self.selected_product_id() is not None:
+        if self.selected_product_ids():
             self.accept()
 
     def _load_products(self) -> None:
+        with _batch(self.table):
+            self._fill_products()
+        self.btn_prev.setEnabled(self._page > 0)
+        self.btn_next.setEnabled(self.model.rowCount() == self.PAGE_SIZE)
+
+    # SQL mirror of _calc_unit_price: the database computes each row's unit
+    # price, so the page arrives as plain tuples with no ORM objects.
+    _UNIT_PRICE_EXPR = case(
+        (Product.fixed_price.is_(True), Product.sale_price),
+        (and_(Product.cost > 0, Product.margin > 0), Product.cost * (1 + Product.margin)),
+        else_=Product.sale_price,
+    )
+
+    def _fill_products(self) -> None:
         self.model.setRowCount(0)
         with get_session() as session:
-            products = session.query(Product).order_by(Product.ref.asc()).all()
-            for p in products:
+            query = session.query(
+                Product.id,
+                Product.ref,
+                Product.short_desc,
+                Product.unit,
+                self._UNIT_PRICE_EXPR,
+            )
+            needle = self.ed_search.text().strip()
+            if needle:
+                pattern = f"%{needle}%"
+                query = query.filter(
+                    or_(Product.ref.ilike(pattern), Product.short_desc.ilike(pattern))
+                )
+            rows = (
+                query.order_by(Product.ref.asc())
+                .limit(self.PAGE_SIZE)
+                .offset(self._page * self.PAGE_SIZE)
+                .all()
+            )
+            for pid, ref, desc, unit, price in rows:
+                ref = ref or ""
+                desc = desc or ""
+                id_item = QStandardItem(str(pid))
+                id_item.setData(f"{ref.lower()}\x00{desc.lower()}", Qt.UserRole)
                 self.model.appendRow(
                     [
-                        QStandardItem(str(p.id)),
-                        QStandardItem(p.ref or ""),
-                        QStandardItem(p.short_desc or ""),
-                        QStandardItem(p.unit or ""),
-                        QStandardItem(f"{_calc_unit_price(p):.2f}"),
+                        id_item,
+                        QStandardItem(ref),
+                        QStandardItem(desc),
+                        QStandardItem(unit or ""),
+                        QStandardItem(f"{float(price or 0):.2f}"),
                     ]
                 )
                 self.model.item(self.model.rowCount() - 1, 4).setTextAlignment(
                     Qt.AlignRight | Qt.AlignVCenter
                 )
 
-    def _apply_filter(self) -> None:
-        text = self.ed_search.text().strip().lower()
-        for row in range(self.model.rowCount()):
-            ref = self.model.item(row, 1).text().lower()
-            desc = self.model.item(row, 2).text().lower()
-            show = (not text) or (text in ref) or (text in desc)
-            self.table.setRowHidden(row, not show)
-
-    def selected_product_id(self) -> int | None:
-        indexes = self.table.selectionModel().selectedRows()
-        if not indexes:
-            return None
-        value = self.model.item(indexes[0].row(), 0).text()
-        return int(value)
+    def _reload_products(self) -> None:
+        # Normalize once and skip the query when the effective needle has not
+        # changed (trailing spaces, case-only edits against ILIKE, ...).
+        needle = self.ed_search.text().strip().lower()
+        if needle == self._last_needle:
+            return
+        self._last_needle = needle
+        self._page = 0
+        self._load_products()
+
+    def _prev_page(self) -> None:
+        if self._page > 0:
+            self._page -= 1
+            self._load_products()
+
+    def _next_page(self) -> None:
+        self._page += 1
+        self._load_products()
+
+    def selected_product_ids(self) -> list[int]:
+        ids: list[int] = []
+        for index in self.table.selectionModel().selectedRows():
+            source = self._proxy.mapToSource(index)
+            ids.append(int(self.model.item(source.row(), 0).text()))
+        return ids
 
 
 class FreeLineDialog(QDialog):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        from ui.i18n import t
         self.setWindowTitle(t("free_line"))
         self.setMinimumWidth(520)
 
@@ -145,7 +464,6 @@ class FreeLineDialog(QDialog):
         root.setContentsMargins(16, 16, 16, 16)
         root.setSpacing(12)
 
-        from ui.i18n import t
         group = QGroupBox(t("line"))
         form = QFormLayout(group)
         form.setLabelAlignment(Qt.AlignRight)
@@ -162,7 +480,6 @@ class FreeLineDialog(QDialog):
         self.ed_discount = QLineEdit("0")
         self.ed_vat = QLineEdit("21")
 
-        from ui.i18n import t
         form.addRow(t("ref"), self.ed_ref)
         form.addRow(t("description"), self.ed_desc)
         form.addRow(t("unit"), self.ed_unit)
@@ -175,7 +492,6 @@ class FreeLineDialog(QDialog):
 
         actions = QHBoxLayout()
         actions.addStretch(1)
-        from ui.i18n import t
         btn_cancel = QPushButton(tu("cancel"))
         btn_ok = QPushButton(tu("add"))
         btn_ok.setDefault(True)
@@ -201,11 +517,20 @@ class FreeLineDialog(QDialog):
 class QuoteEditor(QDialog):
     def __init__(self, parent: QWidget | None = None, quote_id: int | None = None, duplicate: bool = False) -> None:
         super().__init__(parent)
-        from ui.i18n import t
         self.setWindowTitle(t("line_editor"))
         self.setMinimumWidth(900)
         self._quote_id = quote_id
         self._duplicate = duplicate
+        # Coalesce rapid header toggles into one settings write.
+        self._settings_flush = QTimer(self)
+        self._settings_flush.setSingleShot(True)
+        self._settings_flush.setInterval(200)
+        self._settings_flush.timeout.connect(lambda: Settings.load().save())
+        # Coalesce bursts of edits (typing, paste) into one totals pass.
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(50)
+        self._recalc_timer.timeout.connect(self._recalculate_totals)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(16, 16, 16, 16)
@@ -277,8 +602,8 @@ class QuoteEditor(QDialog):
         self.ed_global_discount = QLineEdit("0")
         self.cb_status = QComboBox()
         self._reload_status_items()
-        self.ed_global_vat.textChanged.connect(self._recalculate_totals)
-        self.ed_global_discount.textChanged.connect(self._recalculate_totals)
+        self.ed_global_vat.textChanged.connect(self._recalc_timer.start)
+        self.ed_global_discount.textChanged.connect(self._recalc_timer.start)
 
         self._header_fields = [
             ("number", self.ed_number),
@@ -309,9 +634,8 @@ class QuoteEditor(QDialog):
         self._save_header_state(expanded)
 
     def _save_header_state(self, expanded: bool) -> None:
-        settings = Settings.load()
-        settings.set("quote_header_expanded", bool(expanded))
-        settings.save()
+        Settings.load().set("quote_header_expanded", bool(expanded))
+        self._settings_flush.start()
 
     def _restore_header_state(self) -> None:
         settings = Settings.load()
@@ -340,16 +664,17 @@ class QuoteEditor(QDialog):
         actions.addStretch(1)
         v.addLayout(actions)
 
-        self.table = QTableWidget(0, 9)
+        self.model = QuoteLinesModel(self)
+        self.model.line_changed.connect(self._on_line_changed)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setItemDelegate(NumericAlignDelegate(self.table))
         self.table.setObjectName("QuoteLinesTable")
-        self._set_table_headers()
         self.table.setAlternatingRowColors(True)
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
-        self.table.setEditTriggers(QTableWidget.DoubleClicked | QTableWidget.SelectedClicked)
-        self.table.itemChanged.connect(self._on_line_changed)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
+        self.table.setEditTriggers(QTableView.DoubleClicked | QTableView.SelectedClicked)
         header = self.table.horizontalHeader()
         header.setStretchLastSection(True)
         header.setMinimumHeight(32)
@@ -375,14 +700,22 @@ class QuoteEditor(QDialog):
         h.setSpacing(12)
 
         h.addStretch(1)
-        self.lbl_subtotal = QLabel(f"{t('subtotal')}: 0.00")
-        self.lbl_vat = QLabel(f"{t('vat')}: 0.00")
-        self.lbl_total = QLabel(f"{t('total')}: 0.00")
+        self._refresh_totals_prefixes()
+        self.lbl_subtotal = QLabel(self._pfx_subtotal + "0.00")
+        self.lbl_vat = QLabel(self._pfx_vat + "0.00")
+        self.lbl_total = QLabel(self._pfx_total + "0.00")
         h.addWidget(self.lbl_subtotal)
         h.addWidget(self.lbl_vat)
         h.addWidget(self.lbl_total)
         return panel
 
+    def _refresh_totals_prefixes(self) -> None:
+        # Constant between language changes; rebuilt by _reload_texts so the
+        # per-keystroke recompute does no translation lookups.
+        self._pfx_subtotal = f"{t('subtotal')}: "
+        self._pfx_vat = f"{t('vat')}: "
+        self._pfx_total = f"{t('total')}: "
+
     def _build_actions(self) -> QHBoxLayout:
         row = QHBoxLayout()
         self.btn_export_pdf = QPushButton(tu("export_pdf"))
@@ -415,19 +748,7 @@ class QuoteEditor(QDialog):
         return row
 
     def _set_table_headers(self) -> None:
-        self.table.setHorizontalHeaderLabels(
-            [
-                t("quantity"),
-                t("ref_short"),
-                t("description"),
-                t("unit"),
-                t("sale_price"),
-                t("discount_short"),
-                t("vat_short"),
-                t("subtotal"),
-                t("total"),
-            ]
-        )
+        self.model.retranslate()
 
     def _reload_status_items(self) -> None:
         self.cb_status.clear()
@@ -453,25 +774,15 @@ class QuoteEditor(QDialog):
             label = self._header_form.labelForField(widget)
             if label is not None:
                 label.setText(t(key))
-        current_status = self.cb_status.currentText().lower()
+        current_status = self.cb_status.currentText()
         self._reload_status_items()
-        status_map = {
-            "draft": t("draft"),
-            "borrador": t("draft"),
-            "sent": t("sent"),
-            "enviado": t("sent"),
-            "accepted": t("accepted"),
-            "aceptado": t("accepted"),
-            "rejected": t("rejected"),
-            "rechazado": t("rejected"),
-            "rexeitado": t("rejected"),
-        }
-        new_status = status_map.get(current_status)
+        new_status = _translated_status(current_status)
         if new_status:
             idx = self.cb_status.findText(new_status)
             if idx >= 0:
                 self.cb_status.setCurrentIndex(idx)
         self._set_table_headers()
+        self._refresh_totals_prefixes()
         self._recalculate_totals()
 
     def _apply_cost_visibility(self, show: bool) -> None:
@@ -479,14 +790,25 @@ class QuoteEditor(QDialog):
         self.btn_export_xlsx_internal.setVisible(show)
 
     def _load_clients(self) -> None:
-        self.cb_client.clear()
-        with get_session() as session:
-            for client in session.query(Client).order_by(Client.name.asc()).all():
-                self.cb_client.addItem(client.name, client.id)
+        with _batch(self.cb_client):
+            self.cb_client.clear()
+            with get_session() as session:
+                rows = (
+                    session.query(Client.name, Client.id)
+                    .order_by(Client.name.asc())
+                    .all()
+                )
+            for name, client_id in rows:
+                self.cb_client.addItem(name, client_id)
 
     def _load_quote(self, quote_id: int, duplicate: bool) -> None:
         with get_session() as session:
-            quote = session.get(Quote, quote_id)
+            stmt = (
+                select(Quote)
+                .options(selectinload(Quote.lines))
+                .where(Quote.id == quote_id)
+            )
+            quote = session.execute(stmt).scalar_one_or_none()
             if quote is None:
                 return
             if duplicate:
@@ -494,19 +816,8 @@ class QuoteEditor(QDialog):
                 self.cb_status.setCurrentText(t("draft"))
             else:
                 self.ed_number.setText(quote.number or "")
-                status = (quote.status or "").lower()
-                map_status = {
-                    "draft": t("draft"),
-                    "borrador": t("draft"),
-                    "sent": t("sent"),
-                    "enviado": t("sent"),
-                    "accepted": t("accepted"),
-                    "aceptado": t("accepted"),
-                    "rejected": t("rejected"),
-                    "rechazado": t("rejected"),
-                    "rexeitado": t("rejected"),
-                }
-                self.cb_status.setCurrentText(map_status.get(status, quote.status or t("draft")))
+                status = _translated_status(quote.status or "")
+                self.cb_status.setCurrentText(status or quote.status or t("draft"))
             self.ed_date.setDate(quote.date or date.today())
             self.sp_valid.setValue(quote.valid_days or 30)
             self.ed_global_vat.setText(str(quote.global_vat or 0))
@@ -515,68 +826,57 @@ class QuoteEditor(QDialog):
             if idx >= 0:
                 self.cb_client.setCurrentIndex(idx)
 
-            self.table.setRowCount(0)
-            for line in quote.lines:
-                self._append_line(
-                    LineData(
-                        product_id=line.product_id,
-                        ref=line.ref_snapshot or "",
-                        desc=line.desc_snapshot or "",
-                        unit=line.unit_snapshot or "",
-                        qty=float(line.qty or 0),
-                        unit_price=float(line.unit_price_snapshot or 0),
-                        discount=float(line.discount or 0),
-                        vat=float(line.vat or 0),
-                    )
+            lines = [
+                LineData(
+                    product_id=line.product_id,
+                    ref=line.ref_snapshot or "",
+                    desc=line.desc_snapshot or "",
+                    unit=line.unit_snapshot or "",
+                    qty=float(line.qty or 0),
+                    unit_price=float(line.unit_price_snapshot or 0),
+                    discount=float(line.discount or 0),
+                    vat=float(line.vat or 0),
                 )
+                for line in quote.lines
+            ]
+
+        self.model.set_lines(lines)
+        self._recalculate_totals()
 
     def _append_line(self, data: LineData) -> None:
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-
-        values = [
-            f"{data.qty:.2f}",
-            data.ref,
-            data.desc,
-            data.unit,
-            f"{data.unit_price:.2f}",
-            f"{data.discount:.2f}",
-            f"{data.vat:.2f}",
-            "0.00",
-            "0.00",
-        ]
-        for col, val in enumerate(values):
-            item = QTableWidgetItem(val)
-            if col in {0, 4, 5, 6, 7, 8}:
-                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            if col == 1:
-                item.setData(Qt.UserRole, data.product_id)
-            self.table.setItem(row, col, item)
+        self._append_lines([data])
 
-        self._recalculate_row(row)
+    def _append_lines(self, lines: list[LineData]) -> None:
+        self.model.append_lines(lines)
+        self._recalculate_totals()
 
     def _add_from_catalog(self) -> None:
         picker = ProductPicker(self)
         if picker.exec() != QDialog.Accepted:
             return
-        product_id = picker.selected_product_id()
-        if product_id is None:
+        product_ids = picker.selected_product_ids()
+        if not product_ids:
             return
         with get_session() as session:
-            product = session.get(Product, product_id)
-            if product is None:
-                return
-            self._append_line(
-                LineData(
-                    product_id=product.id,
-                    ref=product.ref or "",
-                    desc=product.short_desc or "",
-                    unit=product.unit or "",
-                    qty=1.0,
-                    unit_price=_calc_unit_price(product),
-                    discount=0.0,
-                    vat=float(product.vat or 0),
-                )
+            products = (
+                session.execute(select(Product).where(Product.id.in_(product_ids)))
+                .scalars()
+                .all()
+            )
+            self._append_lines(
+                [
+                    LineData(
+                        product_id=product.id,
+                        ref=product.ref or "",
+                        desc=product.short_desc or "",
+                        unit=product.unit or "",
+                        qty=1.0,
+                        unit_price=_calc_unit_price(product),
+                        discount=0.0,
+                        vat=float(product.vat or 0),
+                    )
+                    for product in products
+                ]
             )
 
     def _add_free_line(self) -> None:
@@ -585,83 +885,40 @@ class QuoteEditor(QDialog):
             return
         data = dlg.values()
         if not data.desc:
-            from ui.i18n import t
             QMessageBox.warning(self, t("line"), t("description_required"))
             return
         self._append_line(data)
 
     def _remove_line(self) -> None:
-        row = self.table.currentRow()
-        if row < 0:
+        index = self.table.currentIndex()
+        if not index.isValid():
             return
-        self.table.removeRow(row)
+        self.model.remove_row(index.row())
         self._recalculate_totals()
 
-    def _on_line_changed(self, item: QTableWidgetItem) -> None:
-        row = item.row()
-        self._recalculate_row(row)
-
-    def _recalculate_row(self, row: int) -> None:
-        qty = _to_float(self._cell(row, 0), 0)
-        price = _to_float(self._cell(row, 4), 0)
-        discount = _to_float(self._cell(row, 5), 0)
-        vat = _to_float(self._cell(row, 6), 0)
-
-        line_subtotal = qty * price * (1 - discount / 100.0)
-        line_total = line_subtotal * (1 + vat / 100.0)
-
-        self.table.blockSignals(True)
-        self._set_cell(row, 7, f"{line_subtotal:.2f}")
-        self._set_cell(row, 8, f"{line_total:.2f}")
-        self.table.blockSignals(False)
-        self._recalculate_totals()
+    def _on_line_changed(self, _row: int) -> None:
+        self._recalc_timer.start()
 
     def _recalculate_totals(self) -> None:
-        subtotal = 0.0
-        vat_total = 0.0
-        for row in range(self.table.rowCount()):
-            sub = _to_float(self._cell(row, 7), 0)
-            tot = _to_float(self._cell(row, 8), 0)
-            subtotal += sub
-            vat_total += max(tot - sub, 0)
-
-        global_discount = _to_float(self.ed_global_discount.text(), 0)
-        subtotal_after = subtotal * (1 - global_discount / 100.0)
-
-        global_vat = _to_float(self.ed_global_vat.text(), 0)
-        if global_vat > 0:
-            vat_total = subtotal_after * (global_vat / 100.0)
-
-        total = subtotal_after + vat_total
-
-        from ui.i18n import t
-        self.lbl_subtotal.setText(f"{t('subtotal')}: {subtotal_after:.2f}")
-        self.lbl_vat.setText(f"{t('vat')}: {vat_total:.2f}")
-        self.lbl_total.setText(f"{t('total')}: {total:.2f}")
-
-    def _cell(self, row: int, col: int) -> str:
-        item = self.table.item(row, col)
-        return item.text() if item else ""
-
-    def _set_cell(self, row: int, col: int, value: str) -> None:
-        item = self.table.item(row, col)
-        if item is None:
-            item = QTableWidgetItem(value)
-            item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(row, col, item)
-        else:
-            item.setText(value)
+        subtotal_after, vat_total, total = _totals_from_arrays(
+            self.model.subs,
+            self.model.tots,
+            _to_float(self.ed_global_discount.text(), 0),
+            _to_float(self.ed_global_vat.text(), 0),
+        )
+
+        self.lbl_subtotal.setText(self._pfx_subtotal + _FMT2(subtotal_after))
+        self.lbl_vat.setText(self._pfx_vat + _FMT2(vat_total))
+        self.lbl_total.setText(self._pfx_total + _FMT2(total))
 
     def _save(self) -> None:
         client_id = self.cb_client.currentData()
         if not client_id:
-            from ui.i18n import t
             QMessageBox.warning(self, t("quotes"), t("select_client"))
             return
 
         lines = self._collect_lines()
         if not lines:
-            from ui.i18n import t
             QMessageBox.warning(self, t("quotes"), t("add_line_required"))
             return
 
@@ -684,26 +941,35 @@ class QuoteEditor(QDialog):
             quote.vat_mode = "line"
             quote.notes = ""
 
+            # Flush the orphan deletes and make sure quote.id is assigned,
+            # then insert all lines in one batched statement instead of
+            # instrumenting a QuoteLine object per row.
             quote.lines.clear()
+            session.flush()
+            mappings = []
             for line in lines:
                 line_subtotal = line.qty * line.unit_price * (1 - line.discount / 100.0)
                 line_total = line_subtotal * (1 + line.vat / 100.0)
-                quote.lines.append(
-                    QuoteLine(
-                        product_id=line.product_id,
-                        ref_snapshot=line.ref,
-                        desc_snapshot=line.desc,
-                        unit_snapshot=line.unit,
-                        qty=line.qty,
-                        unit_price_snapshot=line.unit_price,
-                        discount=line.discount,
-                        vat=line.vat,
-                        line_subtotal=line_subtotal,
-                        line_total=line_total,
-                    )
+                mappings.append(
+                    {
+                        "quote_id": quote.id,
+                        "product_id": line.product_id,
+                        "ref_snapshot": line.ref,
+                        "desc_snapshot": line.desc,
+                        "unit_snapshot": line.unit,
+                        "qty": line.qty,
+                        "unit_price_snapshot": line.unit_price,
+                        "discount": line.discount,
+                        "vat": line.vat,
+                        "line_subtotal": line_subtotal,
+                        "line_total": line_total,
+                    }
                 )
+            session.bulk_insert_mappings(QuoteLine, mappings)
 
-            subtotal, vat_total, total = _compute_totals(lines, quote.global_discount, quote.global_vat)
+            subtotal, vat_total, total = _totals_from_arrays(
+                self.model.subs, self.model.tots, quote.global_discount, quote.global_vat
+            )
             quote.subtotal = subtotal
             quote.vat_total = vat_total
             quote.total = total
@@ -714,46 +980,64 @@ class QuoteEditor(QDialog):
 
     def _export_pdf(self, internal: bool = False) -> None:
         if not self._quote_id:
-            from ui.i18n import t
             QMessageBox.information(self, t("export"), t("export_save_first"))
             return
-        path = export_quote_pdf(Path(f"presupuesto_{self._quote_id}.pdf"), self._quote_id, include_costs=internal)
-        QMessageBox.information(self, t("export"), f"{t('pdf_generated')}: {path}")
+        self._run_export(
+            export_quote_pdf, Path(f"presupuesto_{self._quote_id}.pdf"), "pdf_generated", internal
+        )
 
     def _export_xlsx(self, internal: bool = False) -> None:
         if not self._quote_id:
-            from ui.i18n import t
             QMessageBox.information(self, t("export"), t("export_save_first"))
             return
-        path = export_quote_xlsx(Path(f"presupuesto_{self._quote_id}.xlsx"), self._quote_id, include_costs=internal)
-        QMessageBox.information(self, t("export"), f"{t('xlsx_generated')}: {path}")
+        self._run_export(
+            export_quote_xlsx, Path(f"presupuesto_{self._quote_id}.xlsx"), "xlsx_generated", internal
+        )
+
+    def _run_export(self, fn, path: Path, done_key: str, internal: bool) -> None:
+        self._set_exports_enabled(False)
+        task = ExportTask(fn, path, self._quote_id, include_costs=internal)
+        task.signals.done.connect(lambda result: self._export_finished(done_key, result))
+        task.signals.failed.connect(self._export_failed)
+        # Keep a reference so the signals object outlives the worker run.
+        self._export_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _export_finished(self, done_key: str, result: str) -> None:
+        self._set_exports_enabled(True)
+        QMessageBox.information(self, t("export"), f"{t(done_key)}: {result}")
+
+    def _export_failed(self, message: str) -> None:
+        self._set_exports_enabled(True)
+        QMessageBox.warning(self, t("export"), message)
+
+    def _set_exports_enabled(self, enabled: bool) -> None:
+        for btn in (
+            self.btn_export_pdf,
+            self.btn_export_xlsx,
+            self.btn_export_pdf_internal,
+            self.btn_export_xlsx_internal,
+        ):
+            btn.setEnabled(enabled)
 
     def _collect_lines(self) -> list[LineData]:
-        data: list[LineData] = []
-        for row in range(self.table.rowCount()):
-            product_id = None
-            ref_item = self.table.item(row, 1)
-            if ref_item is not None:
-                product_id = ref_item.data(Qt.UserRole)
-            data.append(
-                LineData(
-                    product_id=product_id,
-                    ref=self._cell(row, 1),
-                    desc=self._cell(row, 2),
-                    unit=self._cell(row, 3),
-                    qty=_to_float(self._cell(row, 0), 0),
-                    unit_price=_to_float(self._cell(row, 4), 0),
-                    discount=_to_float(self._cell(row, 5), 0),
-                    vat=_to_float(self._cell(row, 6), 0),
-                )
-            )
-        return data
+        return self.model.line_datas()
+
+
+# Bound once: skips the str attribute lookup on every formatted cell/label.
+_FMT2 = "{:.2f}".format
+
+# _to_float sits on every edit path; translate with a prebuilt table and
+# keep the except clause narrow so the common cases stay cheap.
+_COMMA_TRANS = str.maketrans({",": "."})
 
 
 def _to_float(value: str, default: float) -> float:
+    if not value:
+        return default
     try:
-        return float(value.replace(",", "."))
-    except Exception:
+        return float(value.translate(_COMMA_TRANS))
+    except ValueError:
         return default
 
 
@@ -768,22 +1052,19 @@ def _calc_unit_price(product: Product) -> float:
 
 
 def _next_quote_number() -> str:
-    settings = Settings.load()
-    prefix = settings.get("quote_prefix", "PRES-") or "PRES-"
+    prefix = Settings.load().get("quote_prefix", "PRES-") or "PRES-"
     with get_session() as session:
-        last = session.query(Quote).order_by(Quote.id.desc()).first()
-        next_id = (last.id + 1) if last is not None else 1
-        return f"{prefix}{next_id:04d}"
-
-
-def _compute_totals(lines: list[LineData], global_discount: float, global_vat: float) -> tuple[float, float, float]:
-    subtotal = 0.0
-    vat_total = 0.0
-    for line in lines:
-        line_subtotal = line.qty * line.unit_price * (1 - line.discount / 100.0)
-        line_total = line_subtotal * (1 + line.vat / 100.0)
-        subtotal += line_subtotal
-        vat_total += max(line_total - line_subtotal, 0)
+        last_id = session.query(func.max(Quote.id)).scalar() or 0
+        return f"{prefix}{last_id + 1:04d}"
+
+
+def _totals_from_arrays(
+    subs: list[float], tots: list[float], global_discount: float, global_vat: float
+) -> tuple[float, float, float]:
+    # The numeric path works on the parallel float lists the lines model
+    # already maintains, so recomputes touch no LineData objects at all.
+    subtotal = sum(subs)
+    vat_total = sum(max(tot - sub, 0.0) for sub, tot in zip(subs, tots))
 
     subtotal_after = subtotal * (1 - global_discount / 100.0)
     if global_vat > 0:
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtWidgets import (
     QComboBox,
     QDateEdit,
@@ -20,12 +30,226 @@ from PySide6.QtWidgets import (
     QHeaderView,
 )
 
+from sqlalchemy import case, func
+
 from db.models import Client, Quote
 from db.session import get_session
 from ui.quote_editor import QuoteEditor
 from ui.i18n import t, tu
 from services.exporter import export_quote_pdf, export_quote_xlsx
-from ui.numeric_delegate import NumericAlignDelegate
+from settings import Settings
+from ui.app_events import app_events
+from ui.icons import std_icon
+from ui.tasks import ExportTask
+
+
+class QuotesModel(QAbstractTableModel):
+    """Row tuples behind the quotes table.
+
+    Each row is (id, number, client, date, status, total) with the display
+    strings prebuilt, so refreshing the list is one model reset with no
+    per-cell QStandardItem allocations or setTextAlignment calls.
+    """
+
+    COL_ID = 0
+    COL_TOTAL = 5
+    PAGE_SIZE = 200
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: list[tuple] = []
+        self._total = 0
+        self._fetch_page = None
+        self.retranslate()
+
+    def retranslate(self) -> None:
+        self._headers = ["ID", t("number"), t("client"), t("date"), t("status"), t("total")]
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._headers) - 1)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            value = self._rows[index.row()][index.column()]
+            return str(value) if index.column() == self.COL_ID else value
+        if role == Qt.TextAlignmentRole and index.column() == self.COL_TOTAL:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def sort(self, column: int, order=Qt.AscendingOrder) -> None:
+        if column < 0:
+            return
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(key=lambda row: row[column], reverse=order == Qt.DescendingOrder)
+        self.layoutChanged.emit()
+
+    def begin_paged(self, total: int, first_page: list[tuple], fetch_page) -> None:
+        """Show the first page; further pages arrive through fetchMore."""
+        self.beginResetModel()
+        self._rows = first_page
+        self._total = total
+        self._fetch_page = fetch_page
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and len(self._rows) < self._total
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid() or self._fetch_page is None:
+            return
+        rows = self._fetch_page(len(self._rows))
+        if not rows:
+            self._total = len(self._rows)
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def row_id(self, row: int) -> int:
+        return self._rows[row][self.COL_ID]
+
+    def _row_for_id(self, quote_id: int) -> int:
+        for row, values in enumerate(self._rows):
+            if values[self.COL_ID] == quote_id:
+                return row
+        return -1
+
+    def update_cell(self, quote_id: int, column: int, value) -> bool:
+        """Patch one cell in place; False when the row is not loaded."""
+        row = self._row_for_id(quote_id)
+        if row < 0:
+            return False
+        values = list(self._rows[row])
+        values[column] = value
+        self._rows[row] = tuple(values)
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+        return True
+
+    def remove_row_by_id(self, quote_id: int) -> bool:
+        row = self._row_for_id(quote_id)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._total = max(0, self._total - 1)
+        self.endRemoveRows()
+        return True
+
+
+# The client dropdown is rebuilt on every view construction and language
+# switch; cache the (id, name) list per process and drop it when a client
+# is added, edited or deleted.
+_CLIENTS_CACHE: list[tuple[int, str]] | None = None
+
+
+def _get_clients(session) -> list[tuple[int, str]]:
+    global _CLIENTS_CACHE
+    if _CLIENTS_CACHE is None:
+        _CLIENTS_CACHE = (
+            session.query(Client.id, Client.name).order_by(Client.name.asc()).all()
+        )
+    return _CLIENTS_CACHE
+
+
+def _invalidate_clients_cache() -> None:
+    global _CLIENTS_CACHE
+    _CLIENTS_CACHE = None
+
+
+app_events.clients_changed.connect(_invalidate_clients_cache)
+
+
+def _query_count(session, clauses: list) -> int:
+    q = session.query(func.count(Quote.id))
+    if clauses:
+        q = q.filter(*clauses)
+    return q.scalar() or 0
+
+
+@lru_cache(maxsize=4)
+def _status_label_expr(lang: str):
+    """CASE expression translating stored status values inside the query."""
+    return case(
+        (func.lower(Quote.status).in_(("draft", "borrador")), t("draft")),
+        (func.lower(Quote.status).in_(("sent", "enviado")), t("sent")),
+        (func.lower(Quote.status).in_(("accepted", "aceptado")), t("accepted")),
+        (
+            func.lower(Quote.status).in_(("rejected", "rechazado", "rexeitado")),
+            t("rejected"),
+        ),
+        else_=func.coalesce(Quote.status, ""),
+    )
+
+
+def _query_page(session, clauses: list, offset: int) -> list[tuple]:
+    # Column-only query: the table shows six scalar fields, so skip ORM
+    # instance hydration entirely and work on plain row tuples. The
+    # status comes back already localized via the CASE expression.
+    q = session.query(
+        Quote.id,
+        Quote.number,
+        Client.name,
+        Quote.date,
+        _status_label_expr(_current_lang()),
+        func.printf("%.2f", func.coalesce(Quote.total, 0)),
+    ).join(Client, Quote.client_id == Client.id)
+    if clauses:
+        q = q.filter(*clauses)
+    rows = (
+        q.order_by(Quote.date.desc())
+        .limit(QuotesModel.PAGE_SIZE)
+        .offset(offset)
+        .all()
+    )
+    return [
+        (
+            quote_id,
+            number or "",
+            client_name or "",
+            str(quote_date) if quote_date else "",
+            status_label,
+            total_str,
+        )
+        for quote_id, number, client_name, quote_date, status_label, total_str in rows
+    ]
+
+
+class _QuotesLoaderSignals(QObject):
+    rows_ready = Signal(int, int, list)
+
+
+class _QuotesLoader(QRunnable):
+    """Run the count plus first-page query off the GUI thread.
+
+    The filter clauses are built from the widgets before the worker starts,
+    and rows are converted to plain tuples inside run(), so the GUI thread
+    never blocks on SQL nor touches detached ORM objects.
+    """
+
+    def __init__(self, generation: int, clauses: list) -> None:
+        super().__init__()
+        self._generation = generation
+        self._clauses = clauses
+        self.signals = _QuotesLoaderSignals()
+
+    def run(self) -> None:
+        with get_session() as session:
+            total = _query_count(session, self._clauses)
+            rows = _query_page(session, self._clauses, 0)
+        self.signals.rows_ready.emit(self._generation, total, rows)
 
 
 class QuotesView(QWidget):
@@ -38,6 +262,19 @@ class QuotesView(QWidget):
 
     def __init__(self) -> None:
         super().__init__()
+        self._load_generation = 0
+        self._exporting = False
+
+        # Reused for the GUI-thread reads (client dropdown, scroll-driven
+        # pages); writes and the pooled loader keep their own sessions.
+        self._read_session = get_session()
+
+        # Rapid filter edits (date spinners, combo scrolling) collapse into
+        # a single query once the widgets settle.
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(200)
+        self._reload_timer.timeout.connect(self._load_quotes_now)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -53,10 +290,12 @@ class QuotesView(QWidget):
         layout.addLayout(self._build_actions())
         layout.addWidget(self._build_table(), 1)
 
-        self._load_filters()
-        self._load_quotes()
-        from ui.app_events import app_events
+        # Defer the initial loads past construction so the tab paints
+        # immediately and the data arrives on the next event-loop pass.
+        QTimer.singleShot(0, self._load_filters)
+        QTimer.singleShot(0, self._load_quotes_now)
         app_events.language_changed.connect(self._reload_texts)
+        app_events.clients_changed.connect(self._load_filters)
 
     def _build_filters(self) -> QFormLayout:
         form = QFormLayout()
@@ -103,30 +342,30 @@ class QuotesView(QWidget):
         row.setSpacing(8)
 
         self.btn_new = QPushButton(tu("new"))
-        self.btn_new.setIcon(self.style().standardIcon(QStyle.SP_FileIcon))
+        self.btn_new.setIcon(std_icon(QStyle.SP_FileIcon))
         self.btn_new.clicked.connect(self._new_quote)
 
         self.btn_edit = QPushButton(tu("edit"))
-        self.btn_edit.setIcon(self.style().standardIcon(QStyle.SP_FileDialogDetailedView))
+        self.btn_edit.setIcon(std_icon(QStyle.SP_FileDialogDetailedView))
         self.btn_edit.clicked.connect(self._edit_quote)
 
         self.btn_dup = QPushButton(tu("duplicate"))
-        self.btn_dup.setIcon(self.style().standardIcon(QStyle.SP_FileDialogNewFolder))
+        self.btn_dup.setIcon(std_icon(QStyle.SP_FileDialogNewFolder))
         self.btn_dup.clicked.connect(self._duplicate_quote)
 
         self.btn_status = QPushButton(tu("change_status"))
-        self.btn_status.setIcon(self.style().standardIcon(QStyle.SP_BrowserReload))
+        self.btn_status.setIcon(std_icon(QStyle.SP_BrowserReload))
         self.btn_status.clicked.connect(self._toggle_status)
 
         self.btn_delete = QPushButton(tu("delete"))
-        self.btn_delete.setIcon(self.style().standardIcon(QStyle.SP_TrashIcon))
+        self.btn_delete.setIcon(std_icon(QStyle.SP_TrashIcon))
         self.btn_delete.clicked.connect(self._delete_quote)
 
         self.btn_export_pdf = QPushButton(tu("export_pdf"))
-        self.btn_export_pdf.setIcon(self.style().standardIcon(QStyle.SP_DialogSaveButton))
+        self.btn_export_pdf.setIcon(std_icon(QStyle.SP_DialogSaveButton))
         self.btn_export_pdf.clicked.connect(self._export_pdf)
         self.btn_export_xlsx = QPushButton(tu("export_xlsx"))
-        self.btn_export_xlsx.setIcon(self.style().standardIcon(QStyle.SP_DialogSaveButton))
+        self.btn_export_xlsx.setIcon(std_icon(QStyle.SP_DialogSaveButton))
         self.btn_export_xlsx.clicked.connect(self._export_xlsx)
         self.btn_export_pdf.setEnabled(False)
         self.btn_export_xlsx.setEnabled(False)
@@ -142,16 +381,14 @@ class QuotesView(QWidget):
         return row
 
     def _build_table(self) -> QTableView:
-        from PySide6.QtGui import QStandardItemModel, QStandardItem
-
-        self.model = QStandardItemModel(0, 6, self)
-        self._set_table_headers()
+        self.model = QuotesModel(self)
 
         table = QTableView()
         table.setObjectName("QuotesTable")
         table.setModel(self.model)
-        table.setItemDelegate(NumericAlignDelegate(table))
         table.setSortingEnabled(True)
+        # No default indicator: rows arrive date-sorted from SQL.
+        table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
         table.setAlternatingRowColors(True)
         table.setSelectionBehavior(QTableView.SelectRows)
         table.setSelectionMode(QTableView.SingleSelection)
@@ -168,72 +405,87 @@ class QuotesView(QWidget):
         table.selectionModel().selectionChanged.connect(self._update_export_buttons)
 
         self.table = table
-        self._item_cls = QStandardItem
         return table
 
     def _load_filters(self) -> None:
+        prev = self.cb_client.currentData()
         self.cb_client.blockSignals(True)
         self.cb_client.clear()
         self.cb_client.addItem(t("all"), 0)
-        with get_session() as session:
-            for client in session.query(Client).order_by(Client.name.asc()).all():
-                self.cb_client.addItem(client.name, client.id)
+        for client_id, name in _get_clients(self._read_session):
+            self.cb_client.addItem(name, client_id)
+        self._read_session.rollback()
+        idx = self.cb_client.findData(prev) if prev else 0
+        self.cb_client.setCurrentIndex(idx if idx >= 0 else 0)
         self.cb_client.blockSignals(False)
+        if prev and idx < 0:
+            # The selected client no longer exists; the table still shows
+            # its quotes, so reload under the "all" fallback.
+            self._load_quotes()
 
-    def _load_quotes(self) -> None:
-        self.model.setRowCount(0)
+    def _filter_clauses(self) -> list:
+        clauses = []
         status = self.cb_status.currentText()
+        if status != t("all"):
+            variants = _status_variants(status)
+            if variants:
+                clauses.append(Quote.status.in_(list(variants)))
+            else:
+                clauses.append(Quote.status == status)
         client_id = self.cb_client.currentData()
+        if client_id and client_id != 0:
+            clauses.append(Quote.client_id == client_id)
+        if self.cb_use_dates.currentIndex() == 1:
+            clauses.append(Quote.date >= self.dt_from.date().toPython())
+            clauses.append(Quote.date <= self.dt_to.date().toPython())
+        return clauses
+
+    def _fetch_rows(self, offset: int) -> list[tuple]:
+        rows = _query_page(self._read_session, self._filter_clauses(), offset)
+        self._read_session.rollback()  # release the read transaction
+        return rows
 
-        use_dates = self.cb_use_dates.currentIndex() == 1
-        from_date = self.dt_from.date().toPython()
-        to_date = self.dt_to.date().toPython()
-
-        with get_session() as session:
-            q = session.query(Quote, Client).join(Client, Quote.client_id == Client.id)
-            if status != t("all"):
-                variants = _status_variants(status)
-                if variants:
-                    q = q.filter(Quote.status.in_(list(variants)))
-                else:
-                    q = q.filter(Quote.status == status)
-            if client_id and client_id != 0:
-                q = q.filter(Quote.client_id == client_id)
-            if use_dates:
-                q = q.filter(Quote.date >= from_date, Quote.date <= to_date)
-            q = q.order_by(Quote.date.desc())
-
-            for quote, client in q.all():
-                self.model.appendRow(
-                    [
-                        self._item_cls(str(quote.id)),
-                        self._item_cls(quote.number or ""),
-                        self._item_cls(client.name or ""),
-                        self._item_cls(str(quote.date) if quote.date else ""),
-                        self._item_cls(_display_status(quote.status)),
-                        self._item_cls(f"{quote.total:.2f}" if quote.total is not None else "0.00"),
-                    ]
-                )
-                self.model.item(self.model.rowCount() - 1, self.COL_TOTAL).setTextAlignment(
-                    Qt.AlignRight | Qt.AlignVCenter
-                )
+    def _load_quotes(self) -> None:
+        self._reload_timer.start()
+
+    def _load_quotes_now(self) -> None:
+        # Stale results from an earlier, slower load are dropped by the
+        # generation check in _on_quotes_loaded.
+        self._load_generation += 1
+        loader = _QuotesLoader(self._load_generation, self._filter_clauses())
+        loader.signals.rows_ready.connect(self._on_quotes_loaded)
+        self._loader = loader
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_quotes_loaded(self, generation: int, total: int, rows: list) -> None:
+        if generation != self._load_generation:
+            return
+        # Keep click-to-sort out of the repopulation, then restore the
+        # user's sort (if any) over the fresh rows in one pass.
+        header = self.table.horizontalHeader()
+        sort_section = header.sortIndicatorSection()
+        sort_order = header.sortIndicatorOrder()
+        self.table.setSortingEnabled(False)
+        self.model.begin_paged(total, rows, self._fetch_rows)
+        self.table.setSortingEnabled(True)
+        if sort_section >= 0:
+            header.setSortIndicator(sort_section, sort_order)
 
     def _selected_quote_id(self) -> int | None:
         indexes = self.table.selectionModel().selectedRows()
         if not indexes:
             return None
-        value = self.model.item(indexes[0].row(), self.COL_ID).text()
-        return int(value)
+        return self.model.row_id(indexes[0].row())
 
     def _update_export_buttons(self) -> None:
-        enabled = self._selected_quote_id() is not None
+        enabled = not self._exporting and self._selected_quote_id() is not None
         self.btn_export_pdf.setEnabled(enabled)
         self.btn_export_xlsx.setEnabled(enabled)
 
     def _new_quote(self) -> None:
         editor = QuoteEditor(self)
         if editor.exec() == QDialog.Accepted:
-            self._load_quotes()
+            self._load_quotes_now()
 
     def _edit_quote(self) -> None:
         quote_id = self._selected_quote_id()
@@ -242,7 +494,7 @@ class QuotesView(QWidget):
             return
         editor = QuoteEditor(self, quote_id=quote_id)
         if editor.exec() == QDialog.Accepted:
-            self._load_quotes()
+            self._load_quotes_now()
 
     def _duplicate_quote(self) -> None:
         quote_id = self._selected_quote_id()
@@ -251,7 +503,7 @@ class QuotesView(QWidget):
             return
         editor = QuoteEditor(self, quote_id=quote_id, duplicate=True)
         if editor.exec() == QDialog.Accepted:
-            self._load_quotes()
+            self._load_quotes_now()
 
     def _toggle_status(self) -> None:
         quote_id = self._selected_quote_id()
@@ -269,7 +521,12 @@ class QuotesView(QWidget):
                 next_status = t("draft")
             quote.status = next_status
             session.commit()
-        self._load_quotes()
+        # Patch the one row unless a status filter could change membership.
+        status_filtered = self.cb_status.currentText() != t("all")
+        if status_filtered or not self.model.update_cell(
+            quote_id, self.COL_STATUS, next_status
+        ):
+            self._load_quotes_now()
 
     def _delete_quote(self) -> None:
         quote_id = self._selected_quote_id()
@@ -290,28 +547,54 @@ class QuotesView(QWidget):
                 return
             session.delete(quote)
             session.commit()
-        self._load_quotes()
+        if not self.model.remove_row_by_id(quote_id):
+            self._load_quotes_now()
 
     def _export_pdf(self) -> None:
         quote_id = self._selected_quote_id()
         if quote_id is None:
             QMessageBox.information(self, t("quotes"), t("select_quote"))
             return
-        path = export_quote_pdf(Path(f"presupuesto_{quote_id}.pdf"), quote_id, include_costs=False)
-        QMessageBox.information(self, t("export"), f"{t('pdf_generated')}: {path}")
+        self._run_export(
+            export_quote_pdf, Path(f"presupuesto_{quote_id}.pdf"), quote_id, "pdf_generated"
+        )
 
     def _export_xlsx(self) -> None:
         quote_id = self._selected_quote_id()
         if quote_id is None:
             QMessageBox.information(self, t("quotes"), t("select_quote"))
             return
-        path = export_quote_xlsx(Path(f"presupuesto_{quote_id}.xlsx"), quote_id, include_costs=False)
-        QMessageBox.information(self, t("export"), f"{t('xlsx_generated')}: {path}")
+        self._run_export(
+            export_quote_xlsx, Path(f"presupuesto_{quote_id}.xlsx"), quote_id, "xlsx_generated"
+        )
+
+    def _run_export(self, fn, path: Path, quote_id: int, done_key: str) -> None:
+        self._set_exporting(True)
+        task = ExportTask(fn, path, quote_id, include_costs=False)
+        task.signals.done.connect(lambda result: self._export_finished(done_key, result))
+        task.signals.failed.connect(self._export_failed)
+        # Keep a reference so the signals object outlives the worker run.
+        self._export_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _export_finished(self, done_key: str, result: str) -> None:
+        self._set_exporting(False)
+        QMessageBox.information(self, t("export"), f"{t(done_key)}: {result}")
+
+    def _export_failed(self, message: str) -> None:
+        self._set_exporting(False)
+        QMessageBox.warning(self, t("export"), message)
+
+    def _set_exporting(self, exporting: bool) -> None:
+        self._exporting = exporting
+        self._update_export_buttons()
+
+    def closeEvent(self, event) -> None:
+        self._read_session.close()
+        super().closeEvent(event)
 
     def _set_table_headers(self) -> None:
-        self.model.setHorizontalHeaderLabels(
-            ["ID", t("number"), t("client"), t("date"), t("status"), t("total")]
-        )
+        self.model.retranslate()
 
     def _reload_texts(self, _lang: str) -> None:
         self.title.setText(tu("quotes"))
@@ -339,30 +622,32 @@ class QuotesView(QWidget):
                 lbl.setText(t(key))
         self._set_table_headers()
         self._load_filters()
-        self._load_quotes()
-
-
-def _display_status(status: str | None) -> str:
-    if not status:
-        return ""
-    lower = status.lower()
-    map_en_to_es = {
-        "draft": t("draft"),
-        "sent": t("sent"),
-        "accepted": t("accepted"),
-        "rejected": t("rejected"),
-    }
-    return map_en_to_es.get(lower, status)
-
-
-def _status_variants(label: str) -> set[str]:
-    lower = label.lower()
-    if lower in {t("draft").lower(), "borrador", "draft"}:
-        return {"draft", "borrador", t("draft")}
-    if lower in {t("sent").lower(), "enviado", "sent"}:
-        return {"sent", "enviado", t("sent")}
-    if lower in {t("accepted").lower(), "aceptado", "accepted"}:
-        return {"accepted", "aceptado", t("accepted")}
-    if lower in {t("rejected").lower(), "rechazado", "rexeitado", "rejected"}:
-        return {"rejected", "rechazado", "rexeitado", t("rejected")}
-    return set()
+        self._load_quotes_now()
+
+
+# Memoizing on (language, value) means the t() lookups and set building
+# happen once per language instead of every call, with no invalidation
+# needed on switch.
+
+def _current_lang() -> str:
+    return Settings.load().get("idioma", "es")
+
+
+def _status_variants(label: str) -> frozenset[str]:
+    return _variants_by_label(_current_lang()).get(label.lower(), frozenset())
+
+
+@lru_cache(maxsize=4)
+def _variants_by_label(lang: str) -> dict[str, frozenset[str]]:
+    """Map every known status alias (lowercased) to its variant group."""
+    groups = (
+        frozenset({"draft", "borrador", t("draft")}),
+        frozenset({"sent", "enviado", t("sent")}),
+        frozenset({"accepted", "aceptado", t("accepted")}),
+        frozenset({"rejected", "rechazado", "rexeitado", t("rejected")}),
+    )
+    mapping: dict[str, frozenset[str]] = {}
+    for group in groups:
+        for alias in group:
+            mapping[alias.lower()] = group
+    return mapping
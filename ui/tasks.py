@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class ExportSignals(QObject):
+    done = Signal(str)
+    failed = Signal(str)
+
+
+class ExportTask(QRunnable):
+    """Run an export function on the global thread pool.
+
+    Results come back on the GUI thread through queued signal delivery.
+    """
+
+    def __init__(self, fn, *args, **kwargs) -> None:
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self.signals = ExportSignals()
+
+    def run(self) -> None:
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except Exception as exc:
+            self.signals.failed.emit(str(exc))
+        else:
+            self.signals.done.emit(str(result))